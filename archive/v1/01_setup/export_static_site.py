@@ -9,18 +9,26 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import hashlib
+import heapq
+import html
 import json
 import logging
+import math
+import os
 import random
 import re
 import shutil
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from statistics import mean, median, pstdev
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 # Attempt to load the original pipeline. If pandas/plotly are missing the
 # imports will fail and we will fall back to a lightweight implementation.
@@ -44,6 +52,34 @@ except ModuleNotFoundError as exc:  # pragma: no cover - handled gracefully
     )
     PIPELINE_AVAILABLE = False
 
+try:  # pragma: no cover - import guard
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    np = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - import guard
+    import pandas as pd  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    pd = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - import guard
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - import guard
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    pa = None  # type: ignore[assignment]
+    pa_csv = None  # type: ignore[assignment]
+
+NUMBA_AVAILABLE = np is not None
+try:  # pragma: no cover - import guard
+    from numba import njit, prange  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    NUMBA_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 logger = logging.getLogger("export_static_site")
 
@@ -53,8 +89,22 @@ STYLES_PY = PROJECT_ROOT / "03_interface" / "components" / "styles.py"
 
 ASSETS_SUBDIR = "assets"
 CSS_FILENAME = "styles.css"
+CHARTS_JS_FILENAME = "charts.js"
+PLOTLY_CDN_URL = "https://cdn.plot.ly/plotly-2.27.0.min.js"
+TIMELINE_MAX_POINTS = 1000
+TIMELINE_TARGET_POINTS = 800
+BUILD_CACHE_FILENAME = ".build-cache.json"
 TEMPLATE_DIRNAME = "_templates"
 INDEX_TEMPLATE_FILENAME = "index.html"
+INDEX_ROW_TEMPLATE = (
+    '<tr><td><a href="%(href)s">%(name)s</a></td>'
+    "<td>%(trackCount)d</td>"
+    "<td>%(uniqueArtists)d</td>"
+    "<td>%(start)s → %(end)s</td>"
+    '<td><a href="%(summaryHref)s">summary</a></td></tr>'
+)
+ZERO_FRACTION_ROW_TEMPLATE = "<tr><td>%s</td><td>%.2f%%</td></tr>"
+CHART_SECTION_TEMPLATE = '<section class="chart-section card"><div id="%s" class="plotly-chart"></div></section>'
 
 IMAGE_SUBDIR = "images"
 THUMBNAIL_SUBDIR = "thumbnails"
@@ -82,6 +132,23 @@ ESSENTIAL_MAPPINGS = {
     "added_at": ["Added At", "added_at", "date_added", "timestamp"],
 }
 
+# Only these CSV columns are read by the fallback pipeline; the rest of a wide
+# Exportify export is skipped at load time.
+_FALLBACK_COLUMNS = frozenset(
+    [*AUDIO_FEATURE_COLUMNS, *ARTIST_COLUMN_CANDIDATES]
+    + [candidate for options in ESSENTIAL_MAPPINGS.values() for candidate in options]
+)
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path for slugify: every character outside [a-z0-9] maps to "-".
+_SLUG_TRANSLATION = {
+    code: "-" for code in range(128) if not chr(code).isdigit() and not "a" <= chr(code) <= "z"
+}
+_GLOBAL_STYLE_RE = re.compile(r"GLOBAL_STYLE\s*=\s*\"\"\"(.*?)\"\"\"", re.DOTALL)
+_STYLE_TAG_RE = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+_LEADING_WS_RE = re.compile(r"^\s+", re.MULTILINE)
+_TEMPLATE_RE = re.compile(r"{{\s*([a-zA-Z0-9_]+)\s*}}")
+
 
 @dataclass
 class DatasetResult:
@@ -103,57 +170,216 @@ class DatasetResult:
         return self.summary_path.name
 
 
+# Column-oriented table: canonical column name -> values, one entry per track.
+Columns = Dict[str, Sequence[object]]
+ChartSpec = Dict[str, object]
+
+
 # ---------------------------------------------------------------------------
 # Fallback pipeline helpers (no pandas/plotly required)
 # ---------------------------------------------------------------------------
 
-def fallback_load_exportify(csv_path: Path) -> List[Dict[str, str]]:
-    with csv_path.open("r", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        return [dict(row) for row in reader]
-
-
-def fallback_clean(rows: List[Dict[str, str]]) -> List[Dict[str, object]]:
-    seen_keys = set()
-    cleaned: List[Dict[str, object]] = []
-    for row in rows:
-        mapped = dict(row)
-        for standard, options in ESSENTIAL_MAPPINGS.items():
-            for candidate in options:
-                if candidate in row and row[candidate] not in (None, ""):
-                    mapped[standard] = row[candidate].strip()
-                    break
-        track = mapped.get("track_name")
-        artist = mapped.get("artist_name")
+def _row_count(columns: Columns) -> int:
+    return len(next(iter(columns.values()), ()))
+
+
+def _pyarrow_load_exportify(csv_path: Path) -> Columns:
+    with csv_path.open("r", encoding="utf-8", newline="") as fh:
+        header = next(csv.reader(fh), [])
+    wanted = [name for name in dict.fromkeys(header) if name in _FALLBACK_COLUMNS]
+    if not wanted:  # an empty include_columns would mean "all columns"
+        return {}
+    # Keep every column as text so the result matches the csv-module reader.
+    table = pa_csv.read_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=1 << 20),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=wanted,
+            column_types={name: pa.string() for name in wanted},
+        ),
+    )
+    return table.to_pydict()
+
+
+def _iter_csv_columns(csv_path: Path, chunksize: int = 0) -> Iterator[Columns]:
+    """Yield the CSV as column chunks of ``chunksize`` rows (0 reads it whole)."""
+    with csv_path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        # Later duplicates win, as with csv.DictReader.
+        positions = {name: idx for idx, name in enumerate(header) if name in _FALLBACK_COLUMNS}
+        width = len(header)
+        columns: Dict[str, List[Optional[str]]] = {name: [] for name in positions}
+        targets = [(columns[name].append, idx) for name, idx in positions.items()]
+        pending = 0
+        yielded = False
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+            for append, idx in targets:
+                append(row[idx])
+            pending += 1
+            if pending == chunksize:
+                yield columns
+                yielded = True
+                columns = {name: [] for name in positions}
+                targets = [(columns[name].append, idx) for name, idx in positions.items()]
+                pending = 0
+        if pending or not yielded:
+            yield columns
+
+
+def fallback_load_exportify(csv_path: Path) -> Columns:
+    if pa_csv is not None:
+        try:
+            return _pyarrow_load_exportify(csv_path)
+        except pa.ArrowInvalid as exc:
+            # pyarrow rejects short or ragged rows; the csv reader pads them.
+            logger.info("Re-reading %s with the csv module: %s", csv_path.name, exc)
+    return next(_iter_csv_columns(csv_path))
+
+
+def _concat_columns(chunks: Iterable[Columns]) -> Columns:
+    merged: Dict[str, List[object]] = {}
+    for chunk in chunks:
+        for name, values in chunk.items():
+            merged.setdefault(name, []).extend(values)
+    return merged
+
+
+def fallback_load_clean_chunked(csv_path: Path, chunksize: int) -> Columns:
+    """Load and clean a CSV ``chunksize`` rows at a time.
+
+    Only one raw chunk is held at once; duplicates are tracked across chunks
+    so the result matches cleaning the whole file in one go.
+    """
+    seen_keys: set[int] = set()
+    cleaned = _concat_columns(
+        fallback_clean(chunk, seen_keys, parse_dates=False)
+        for chunk in _iter_csv_columns(csv_path, chunksize)
+    )
+    cleaned["added_at"] = _parse_added_at(cleaned.get("added_at", []))
+    return cleaned
+
+
+def fallback_clean(
+    columns: Columns, seen_keys: Optional[set[int]] = None, parse_dates: bool = True
+) -> Columns:
+    n_rows = _row_count(columns)
+    mapped: Dict[str, List[Optional[str]]] = {}
+    for standard, options in ESSENTIAL_MAPPINGS.items():
+        candidates = [columns[candidate] for candidate in options if candidate in columns]
+        # Exports normally carry exactly one alias per field, so read it
+        # directly and only coalesce across columns when several exist.
+        if not candidates:
+            mapped[standard] = [None] * n_rows
+        elif len(candidates) == 1:
+            mapped[standard] = [value.strip() if value else None for value in candidates[0]]
+        else:
+            values: List[Optional[str]] = []
+            for i in range(n_rows):
+                value = next((col[i] for col in candidates if col[i] not in (None, "")), None)
+                values.append(value.strip() if value is not None else None)
+            mapped[standard] = values
+
+    tracks = mapped["track_name"]
+    artists = mapped["artist_name"]
+    # 64-bit fingerprints instead of (track, artist) tuples keep the seen set
+    # small on large libraries; collisions are negligible at this width.
+    if seen_keys is None:
+        seen_keys = set()
+    keep: List[int] = []
+    for i in range(n_rows):
+        track = tracks[i]
+        artist = artists[i]
         if not track or not artist:
             continue
-        key = (track.lower(), artist.lower())
+        digest = hashlib.blake2b(f"{track}\0{artist}".lower().encode("utf-8"), digest_size=8).digest()
+        key = int.from_bytes(digest, "little")
         if key in seen_keys:
             continue
         seen_keys.add(key)
-        added_raw = mapped.get("added_at")
-        if isinstance(added_raw, str) and added_raw:
-            try:
-                mapped["added_at"] = datetime.fromisoformat(added_raw.replace("Z", "+00:00"))
-            except ValueError:
-                mapped["added_at"] = None
-        else:
-            mapped["added_at"] = None
-        cleaned.append(mapped)
+        keep.append(i)
+
+    cleaned: Dict[str, List[object]] = {
+        name: [col[i] for i in keep] for name, col in columns.items()
+    }
+    for standard, values in mapped.items():
+        cleaned[standard] = [values[i] for i in keep]
+
+    if parse_dates:
+        cleaned["added_at"] = _parse_added_at(cleaned["added_at"])
     return cleaned
 
 
-def fallback_add_spotify_audio_features(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    rng = random.Random(42)
-    enriched: List[Dict[str, object]] = []
-    for row in rows:
-        enriched_row = dict(row)
-        for feature in AUDIO_FEATURE_COLUMNS:
-            if feature == "tempo":
-                enriched_row[feature] = rng.uniform(60, 200)
+def _parse_timestamp(value: object) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _parse_added_at(values: Sequence[object]) -> Sequence[object]:
+    """Parse ``added_at`` strings, as a ``datetime64[s]`` array when numpy is available and every stamp is UTC."""
+    if np is not None:
+        # Exportify writes whole-second UTC stamps with a trailing "Z", which
+        # numpy parses natively once the designator is dropped. Anything else
+        # (naive or non-UTC stamps, fractions numpy would truncate) keeps the
+        # datetime path below, so labels stay as written and numpy never sees
+        # an offset it would warn about.
+        iso: List[str] = []
+        for value in values:
+            if not isinstance(value, str) or not value:
+                iso.append("NaT")
+            elif "." in value:
+                break
+            elif value.endswith("Z"):
+                iso.append(value[:-1])
+            elif value.endswith("+00:00"):
+                iso.append(value[:-6])
             else:
-                enriched_row[feature] = rng.uniform(0, 1)
-        enriched.append(enriched_row)
+                break
+        else:
+            try:
+                return np.array(iso, dtype="datetime64[s]")
+            except ValueError:
+                pass
+    return [_parse_timestamp(value) for value in values]
+
+
+def fallback_add_spotify_audio_features(columns: Columns) -> Columns:
+    """Attach seeded mock audio features.
+
+    With numpy the features come from ``np.random.default_rng(42)``, whose
+    values differ from the stdlib ``random.Random(42)`` used before; without
+    numpy the original per-track draw order is kept, so those values match
+    earlier builds.
+    """
+    n_rows = _row_count(columns)
+    enriched: Dict[str, Sequence[object]] = dict(columns)
+    if np is not None:
+        # One draw for every feature; each row of the matrix is a contiguous
+        # view, and the values match drawing the features one by one.
+        matrix = np.random.default_rng(42).random((len(AUDIO_FEATURE_COLUMNS), n_rows))
+        for row, feature in zip(matrix, AUDIO_FEATURE_COLUMNS):
+            if feature == "tempo":
+                row *= 140.0
+                row += 60.0
+            enriched[feature] = row
+        return enriched
+
+    # Draw track by track, every feature per track, then split the flat
+    # sequence into columns
+    rng = random.Random(42)
+    bounds = [(60, 200) if feature == "tempo" else (0, 1) for feature in AUDIO_FEATURE_COLUMNS]
+    draws = [rng.uniform(low, high) for _ in range(n_rows) for low, high in bounds]
+    for offset, feature in enumerate(AUDIO_FEATURE_COLUMNS):
+        enriched[feature] = draws[offset::len(bounds)]
     return enriched
 
 
@@ -167,29 +393,129 @@ def _std(values: List[float]) -> Optional[float]:
     return pstdev(values)
 
 
-def fallback_compute_emotion_summary(rows: List[Dict[str, object]]) -> Dict[str, object]:
-    summary = {
-        "audio_features": {},
-        "sentiment": {},
-        "emotion_profile": {},
-        "recommendations": [],
-    }
+if NUMBA_AVAILABLE:
+
+    # fastmath without "nnan": the kernel relies on NaN checks to skip missing values.
+    @njit(parallel=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+    def _column_stats(arr):  # pragma: no cover - compiled
+        """Return (count, mean, std, min, max, zero_count) per row of ``arr``.
+
+        ``arr`` is laid out features x tracks so each feature is contiguous.
+        Mean/std use Welford's single-pass update; NaNs are skipped.
+        """
+        n_features, n_rows = arr.shape
+        out = np.zeros((n_features, 6))
+        for j in prange(n_features):
+            count = 0
+            running_mean = 0.0
+            m2 = 0.0
+            lo = np.inf
+            hi = -np.inf
+            zeros = 0
+            for i in range(n_rows):
+                value = arr[j, i]
+                if np.isnan(value):
+                    continue
+                count += 1
+                delta = value - running_mean
+                running_mean += delta / count
+                m2 += delta * (value - running_mean)
+                lo = min(lo, value)
+                hi = max(hi, value)
+                if value == 0.0:
+                    zeros += 1
+            if count:
+                out[j, 0] = count
+                out[j, 1] = running_mean
+                out[j, 2] = np.sqrt(m2 / count)
+                out[j, 3] = lo
+                out[j, 4] = hi
+                out[j, 5] = zeros
+        return out
+
+
+def _feature_array(columns: Columns, feature: str, n_rows: int) -> "np.ndarray":
+    values = columns.get(feature)
+    if values is None:
+        return np.full(n_rows, np.nan)
+    if isinstance(values, np.ndarray) and values.dtype == np.float64:
+        return values
+    return np.fromiter(
+        (float(value) if isinstance(value, (int, float)) else np.nan for value in values),
+        dtype=np.float64,
+        count=n_rows,
+    )
+
+
+def _audio_feature_stats(columns: Columns) -> Dict[str, Dict[str, float]]:
+    features = AUDIO_FEATURE_COLUMNS[:-1]  # exclude tempo from 0-1 stats
+    stats: Dict[str, Dict[str, float]] = {}
+
+    if NUMBA_AVAILABLE:
+        n_rows = _row_count(columns)
+        arr = np.empty((len(features), n_rows), dtype=np.float64)
+        for j, feature in enumerate(features):
+            arr[j] = _feature_array(columns, feature, n_rows)
+        reduced = _column_stats(arr)
+        for j, feature in enumerate(features):
+            count, mean_val, std_val, min_val, max_val, zeros = reduced[j]
+            if not count:
+                continue
+            stats[feature] = {
+                "mean": float(mean_val),
+                "std": float(std_val),
+                "min": float(min_val),
+                "max": float(max_val),
+                "median": float(np.nanmedian(arr[j])),
+                "count": int(count),
+                "zero_fraction": float(zeros / count),
+            }
+        return stats
+
+    if np is not None:
+        n_rows = _row_count(columns)
+        for feature in features:
+            arr = _feature_array(columns, feature, n_rows)
+            values = arr[~np.isnan(arr)]
+            if not values.size:
+                continue
+            stats[feature] = {
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "median": float(np.median(values)),
+                "count": int(values.size),
+                "zero_fraction": float(np.count_nonzero(values == 0.0) / values.size),
+            }
+        return stats
 
-    for feature in AUDIO_FEATURE_COLUMNS[:-1]:  # exclude tempo from 0-1 stats
-        values = [float(row[feature]) for row in rows if isinstance(row.get(feature), (int, float))]
+    for feature in features:
+        values = [float(value) for value in columns.get(feature, ()) if isinstance(value, (int, float))]
         if not values:
             continue
-        zero_fraction = sum(1 for value in values if value == 0.0) / len(values)
-        summary["audio_features"][feature] = {
+        stats[feature] = {
             "mean": _mean(values),
             "std": _std(values) or 0.0,
             "min": min(values),
             "max": max(values),
             "median": median(values),
             "count": len(values),
-            "zero_fraction": zero_fraction,
-            "trend_index": 0.0,
+            "zero_fraction": sum(1 for value in values if value == 0.0) / len(values),
         }
+    return stats
+
+
+def fallback_compute_emotion_summary(columns: Columns) -> Dict[str, object]:
+    summary = {
+        "audio_features": {},
+        "sentiment": {},
+        "emotion_profile": {},
+        "recommendations": [],
+    }
+
+    for feature, stats in _audio_feature_stats(columns).items():
+        summary["audio_features"][feature] = {**stats, "trend_index": 0.0}
 
     avg_valence = summary["audio_features"].get("valence", {}).get("mean")
     avg_energy = summary["audio_features"].get("energy", {}).get("mean")
@@ -237,18 +563,45 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Remove existing output directory before generating",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=0,
+        help="Clean CSVs this many rows at a time in the fallback pipeline (default: whole file)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes for building datasets (default: one per CPU)",
+    )
     return parser.parse_args(argv)
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    lowered = name.lower()
+    if lowered.isascii():
+        slug = "-".join(part for part in lowered.translate(_SLUG_TRANSLATION).split("-") if part)
+    else:
+        slug = _SLUG_RE.sub("-", lowered).strip("-")
     return slug or "dataset"
 
 
 def discover_csv_files(input_dir: Path) -> List[Path]:
     if not input_dir.exists():
         raise FileNotFoundError(f"Input directory does not exist: {input_dir}")
-    csv_files = sorted(p for p in input_dir.rglob("*.csv") if p.is_file())
+    # os.scandir entries carry their file type, so no extra stat per match.
+    csv_files: List[Path] = []
+    pending = [str(input_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".csv") and entry.is_file():
+                    csv_files.append(Path(entry.path))
+    csv_files.sort()
     if not csv_files:
         raise FileNotFoundError(f"No CSV files found under {input_dir}")
     return csv_files
@@ -264,19 +617,20 @@ def prepare_output_directory(out_dir: Path, force: bool = False) -> Path:
     return assets_dir
 
 
+@functools.lru_cache(maxsize=1)
 def extract_css_from_styles() -> str:
     if not STYLES_PY.exists():
         raise FileNotFoundError(f"Could not find styles.py at {STYLES_PY}")
     text = STYLES_PY.read_text(encoding="utf-8")
-    match = re.search(r"GLOBAL_STYLE\s*=\s*\"\"\"(.*?)\"\"\"", text, re.DOTALL)
+    match = _GLOBAL_STYLE_RE.search(text)
     if not match:
         raise ValueError("Could not locate GLOBAL_STYLE definition in styles.py")
     style_block = match.group(1)
-    style_match = re.search(r"<style>(.*?)</style>", style_block, re.DOTALL)
+    style_match = _STYLE_TAG_RE.search(style_block)
     css = style_match.group(1) if style_match else style_block
     css_lines = [line for line in css.splitlines() if "fonts.googleapis" not in line]
     css = "\n".join(css_lines)
-    css = re.sub(r"^\s+", "", css, flags=re.MULTILINE)
+    css = _LEADING_WS_RE.sub("", css)
     additional_css = """
 body {
     margin: 0;
@@ -656,65 +1010,158 @@ img {
     return css.strip() + "\n\n" + additional_css + "\n"
 
 
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` with raw ``os.write`` calls unless the file already matches."""
+    data = content.encode("utf-8")
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
 def write_css(assets_dir: Path) -> Path:
-    css_content = extract_css_from_styles()
     css_path = assets_dir / CSS_FILENAME
-    css_path.write_text(css_content, encoding="utf-8")
-    logger.info("Wrote CSS to %s", css_path)
+    # The stylesheet is derived from styles.py plus the extra rules in this
+    # script, so it only needs rebuilding when either of them is newer.
+    if css_path.exists() and STYLES_PY.exists():
+        source_mtime = max(STYLES_PY.stat().st_mtime, Path(__file__).stat().st_mtime)
+        if css_path.stat().st_mtime >= source_mtime:
+            logger.info("CSS at %s is up to date", css_path)
+            return css_path
+    if _write_if_changed(css_path, extract_css_from_styles()):
+        logger.info("Wrote CSS to %s", css_path)
     return css_path
 
 
+CHARTS_JS = """function initCharts() {
+    const charts = window.__CHARTS__ || {};
+    for (const [id, spec] of Object.entries(charts)) {
+        Plotly.newPlot(id, spec.data, spec.layout, {responsive: true});
+    }
+}
+"""
+
+
+def write_charts_js(assets_dir: Path) -> Path:
+    js_path = assets_dir / CHARTS_JS_FILENAME
+    if _write_if_changed(js_path, CHARTS_JS):
+        logger.info("Wrote chart loader to %s", js_path)
+    return js_path
+
+
+def _copy_if_newer(src: str, dst: str) -> str:
+    """copytree copy_function that leaves up-to-date destination files alone."""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return shutil.copy2(src, dst)
+    if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime >= src_stat.st_mtime:
+        return dst
+    return shutil.copy2(src, dst)
+
+
 def copy_docs(out_dir: Path) -> None:
     """Copy 06_docs/ content to docs/docs/ for static site."""
     docs_src = PROJECT_ROOT / "06_docs"
     docs_dest = out_dir / "docs"
     if docs_src.exists():
-        shutil.copytree(docs_src, docs_dest, dirs_exist_ok=True)
+        shutil.copytree(docs_src, docs_dest, dirs_exist_ok=True, copy_function=_copy_if_newer)
         logger.info("Copied docs from %s to %s", docs_src, docs_dest)
     else:
         logger.warning("06_docs/ not found, skipping docs copy")
 
 
-def pipeline_process(csv_path: Path) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
+def pipeline_process(csv_path: Path, chunksize: int = 0) -> Tuple[Columns, Dict[str, object]]:
     if PIPELINE_AVAILABLE:
         logger.info("Using pandas-based pipeline for %s", csv_path.name)
         df_raw = dp_load_exportify(csv_path)
         df_clean = dp_clean(df_raw)
         df_audio = dp_add_spotify_audio_features(df_clean)
         summary = dp_compute_emotion_summary(df_audio)
-        rows = df_audio.to_dict(orient="records")  # type: ignore[attr-defined]
-        # Convert timestamps to datetime objects if needed
-        for row in rows:
-            value = row.get("added_at")
-            if value is not None and hasattr(value, "isoformat"):
-                row["added_at"] = value.to_pydatetime()  # type: ignore[call-arg]
-        return rows, summary
+        # Audio features and UTC timestamps stay typed numpy arrays, so the
+        # chart and metadata code can use masks instead of per-value checks.
+        typed: Dict[str, Sequence[object]] = {}
+        for feature in AUDIO_FEATURE_COLUMNS:
+            if feature in df_audio:
+                typed[feature] = pd.to_numeric(df_audio[feature], errors="coerce").to_numpy(dtype=np.float64)
+        added = df_audio["added_at"] if "added_at" in df_audio else None
+        if added is not None and getattr(added.dtype, "tz", None) is not None:
+            typed["added_at"] = added.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[s]")
+        columns = df_audio.drop(columns=list(typed)).to_dict(orient="list")  # type: ignore[attr-defined]
+        if "added_at" in columns:
+            # Naive timestamps keep their previous datetime representation.
+            columns["added_at"] = [
+                value.to_pydatetime() if value is not None and hasattr(value, "isoformat") else value  # type: ignore[union-attr]
+                for value in columns["added_at"]
+            ]
+        columns.update(typed)
+        return columns, summary
 
     logger.info("Using lightweight fallback pipeline for %s", csv_path.name)
-    rows_raw = fallback_load_exportify(csv_path)
-    rows_clean = fallback_clean(rows_raw)
-    rows_audio = fallback_add_spotify_audio_features(rows_clean)
-    summary = fallback_compute_emotion_summary(rows_audio)
-    return rows_audio, summary
+    if chunksize > 0:
+        columns_clean = fallback_load_clean_chunked(csv_path, chunksize)
+    else:
+        # The raw columns are only needed by fallback_clean; not binding them
+        # to a local lets them be freed before audio features are added.
+        columns_clean = fallback_clean(fallback_load_exportify(csv_path))
+    columns_audio = fallback_add_spotify_audio_features(columns_clean)
+    summary = fallback_compute_emotion_summary(columns_audio)
+    return columns_audio, summary
 
 
-def compute_metadata(rows: List[Dict[str, object]], summary: Dict[str, object]) -> Dict[str, object]:
-    track_count = len(rows)
-    artist_col = None
+def artist_column(columns: Columns) -> Sequence[object]:
+    """Return the first available artist column, or an empty sequence."""
     for candidate in ARTIST_COLUMN_CANDIDATES:
-        if any(candidate in row for row in rows):
-            artist_col = candidate
-            break
-    if artist_col is None:
-        artist_col = "artist_name"
-    unique_artists = len({str(row.get(artist_col, "")) for row in rows if row.get(artist_col)})
-
-    dates = [row["added_at"] for row in rows if isinstance(row.get("added_at"), datetime)]
+        if candidate in columns:
+            return columns[candidate]
+    return ()
+
+
+def count_artists(columns: Columns) -> Mapping[str, int]:
+    """Count tracks per artist, in first-seen order."""
+    if pd is not None:
+        # value_counts hashes in C; sort=False keeps first-seen order so ties
+        # resolve the same way as the Counter path.
+        series = pd.Series(artist_column(columns), dtype=object).dropna()
+        series = series[series != ""].astype(str)
+        return series.value_counts(sort=False)
+    return Counter(map(str, filter(None, artist_column(columns))))
+
+
+def compute_metadata(
+    columns: Columns, summary: Dict[str, object], artist_counts: Mapping[str, int]
+) -> Dict[str, object]:
+    track_count = _row_count(columns)
+    unique_artists = len(artist_counts)
+
+    first_added: Optional[datetime] = None
+    last_added: Optional[datetime] = None
+    added_col = columns.get("added_at")
+    if np is not None and isinstance(added_col, np.ndarray):
+        valid = added_col[~np.isnat(added_col)]
+        if valid.size:
+            first_added = valid.min().item()
+            last_added = valid.max().item()
+    elif added_col is not None:
+        for added_at in added_col:
+            if isinstance(added_at, datetime):
+                if first_added is None or added_at < first_added:
+                    first_added = added_at
+                if last_added is None or added_at > last_added:
+                    last_added = added_at
+
     date_range = None
-    if dates:
+    if first_added is not None and last_added is not None:
         date_range = {
-            "start": min(dates).date().isoformat(),
-            "end": max(dates).date().isoformat(),
+            "start": first_added.date().isoformat(),
+            "end": last_added.date().isoformat(),
         }
 
     zero_fraction = {}
@@ -735,75 +1182,208 @@ def compute_metadata(rows: List[Dict[str, object]], summary: Dict[str, object])
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _listdir(directory: Path) -> frozenset:
+    """File names in ``directory``, listed once per run (empty if it is missing)."""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+
 def resolve_thumbnail(slug: str, out_dir: Path) -> str:
-    assets_dir = out_dir / ASSETS_SUBDIR
-    thumbnails_dir = assets_dir / IMAGE_SUBDIR / THUMBNAIL_SUBDIR
+    # One cached listing per directory replaces an exists() probe per extension.
+    images_dir = out_dir / ASSETS_SUBDIR / IMAGE_SUBDIR
+    thumbnails = _listdir(images_dir / THUMBNAIL_SUBDIR)
     for ext in ("png", "jpg", "jpeg", "svg", "webp"):
-        candidate = thumbnails_dir / f"{slug}.{ext}"
-        if candidate.exists():
-            return candidate.relative_to(out_dir).as_posix()
-    default_thumb = assets_dir / IMAGE_SUBDIR / DEFAULT_THUMBNAIL_FILENAME
-    if default_thumb.exists():
-        return default_thumb.relative_to(out_dir).as_posix()
+        if f"{slug}.{ext}" in thumbnails:
+            return f"{ASSETS_SUBDIR}/{IMAGE_SUBDIR}/{THUMBNAIL_SUBDIR}/{slug}.{ext}"
+    if DEFAULT_THUMBNAIL_FILENAME in _listdir(images_dir):
+        return f"{ASSETS_SUBDIR}/{IMAGE_SUBDIR}/{DEFAULT_THUMBNAIL_FILENAME}"
     return ""
 
 
 def apply_index_template(template_text: str, context: Dict[str, str]) -> str:
-    pattern = re.compile(r"{{\s*([a-zA-Z0-9_]+)\s*}}")
-
-    def replacer(match: re.Match[str]) -> str:
-        key = match.group(1)
-        return context.get(key, match.group(0))
-
-    return pattern.sub(replacer, template_text)
-
-
-def render_plotly_script(div_id: str, data: Dict[str, object], layout: Dict[str, object], include_cdn: bool) -> str:
-    script_lines = []
-    if include_cdn:
-        script_lines.append('<script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>')
-    script_lines.append(
-        f"<script>Plotly.newPlot('{div_id}', {json.dumps(data)}, {json.dumps(layout)}, {{responsive: true}});</script>"
+    return _TEMPLATE_RE.sub(lambda match: context.get(match.group(1), match.group(0)), template_text)
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+def _json_default(value: object) -> object:
+    """Serialize the values json/orjson cannot, identically on both paths."""
+    if isinstance(value, datetime):
+        # Covers pandas Timestamps; orjson passes datetimes through to here
+        return value.isoformat()
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            # NaN marks a gap in a chart series; emit it as null like orjson does.
+            return [_finite_or_none(item) if isinstance(item, float) else item for item in value.tolist()]
+        if isinstance(value, np.generic):
+            item = value.item()
+            return _finite_or_none(item) if isinstance(item, float) else item
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_default_or_str(value: object) -> object:
+    """Like _json_default, but fall back to str() for summary files."""
+    try:
+        return _json_default(value)
+    except TypeError:
+        return str(value)
+
+
+def _null_non_finite(value: object) -> object:
+    """Replace NaN/inf floats with None, as orjson does, for the stdlib encoder."""
+    if isinstance(value, float):
+        return _finite_or_none(value)
+    if isinstance(value, dict):
+        return {key: _null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_non_finite(item) for item in value]
+    return value
+
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+
+def _dumps(payload: object, indent: bool = False) -> str:
+    """Serialize a page payload, using orjson when it is installed."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, default=_json_default, option=option).decode("utf-8")
+    return json.dumps(
+        _null_non_finite(payload),
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        allow_nan=False,
+        default=_json_default,
     )
-    return f"<div id=\"{div_id}\" class=\"plotly-chart\"></div>\n" + "\n".join(script_lines)
-
 
-def build_timeline_chart(rows: List[Dict[str, object]], include_cdn: bool) -> Optional[str]:
-    valence = [row.get("valence") for row in rows if isinstance(row.get("valence"), (int, float))]
-    energy = [row.get("energy") for row in rows if isinstance(row.get("energy"), (int, float))]
-    if not valence and not energy:
-        return None
 
-    sorted_rows = sorted(
-        rows,
-        key=lambda row: row.get("added_at") or rows.index(row),
+def _write_json(path: Path, payload: object) -> None:
+    """Stream an indented JSON file to disk, writing NaN as null like _dumps."""
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(_null_non_finite(payload), fh, indent=2, allow_nan=False, default=_json_default_or_str)
+
+
+def chart_spec(div_id: str, data: object, layout: Dict[str, object]) -> ChartSpec:
+    return {"id": div_id, "data": data, "layout": layout}
+
+
+def _lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Pick ``threshold`` points with Largest-Triangle-Three-Buckets downsampling."""
+    n_points = len(xs)
+    if threshold >= n_points or threshold < 3:
+        return list(range(n_points))
+    bucket_size = (n_points - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * bucket_size) + 1
+        avg_end = min(int((bucket + 2) * bucket_size) + 1, n_points)
+        avg_x = sum(xs[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(ys[avg_start:avg_end]) / (avg_end - avg_start)
+        anchor_x, anchor_y = xs[anchor], ys[anchor]
+        range_start = int(bucket * bucket_size) + 1
+        range_end = int((bucket + 1) * bucket_size) + 1
+        best, best_area = range_start, -1.0
+        for j in range(range_start, range_end):
+            area = abs((anchor_x - avg_x) * (ys[j] - anchor_y) - (anchor_x - xs[j]) * (avg_y - anchor_y))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        anchor = best
+    selected.append(n_points - 1)
+    return selected
+
+
+def _ordered_series(columns: Columns, feature: str, order: Sequence[int]) -> Tuple[Sequence[object], bool]:
+    """Return ``feature`` in timeline order and whether it has any values.
+
+    With numpy the series is a float64 array where NaN marks a gap; otherwise
+    it is a list using None.
+    """
+    n_rows = _row_count(columns)
+    if np is not None:
+        series = _feature_array(columns, feature, n_rows)[order]
+        return series, bool((~np.isnan(series)).any())
+    values = columns.get(feature, [None] * n_rows)
+    series = [values[i] if isinstance(values[i], (int, float)) else None for i in order]
+    return series, any(value is not None for value in series)
+
+
+def _timeline_series(x_values: List[object], y_values: Sequence[object]) -> Tuple[List[object], Sequence[object]]:
+    """Downsample long timelines so the page only carries what the chart can show."""
+    if len(y_values) <= TIMELINE_MAX_POINTS:
+        return x_values, y_values
+    if np is not None and isinstance(y_values, np.ndarray):
+        present_idx = np.flatnonzero(~np.isnan(y_values))
+        keep = _lttb_indices(
+            present_idx.astype(np.float64).tolist(),
+            y_values[present_idx].tolist(),
+            TIMELINE_TARGET_POINTS,
+        )
+        rows_idx = present_idx[keep]
+        return [x_values[i] for i in rows_idx.tolist()], y_values[rows_idx]
+    present = [i for i, value in enumerate(y_values) if value is not None]
+    keep = _lttb_indices(
+        [float(i) for i in present],
+        [y_values[i] for i in present],
+        TIMELINE_TARGET_POINTS,
     )
-    x_values = []
-    for idx, row in enumerate(sorted_rows, start=1):
-        added_at = row.get("added_at")
-        if isinstance(added_at, datetime):
-            x_values.append(added_at.isoformat())
-        else:
-            x_values.append(idx)
+    rows = [present[k] for k in keep]
+    return [x_values[i] for i in rows], [y_values[i] for i in rows]
+
+
+def build_timeline_chart(columns: Columns) -> Optional[ChartSpec]:
+    n_rows = _row_count(columns)
+    added_col = columns.get("added_at", [None] * n_rows)
+    if np is not None and isinstance(added_col, np.ndarray):
+        # NaT sorts last; both pipelines only build this array from UTC stamps.
+        order = np.argsort(added_col, kind="stable").tolist()
+        labels = [
+            None if label == "NaT" else f"{label}+00:00"
+            for label in np.datetime_as_string(added_col, unit="s").tolist()
+        ]
+    else:
+        # Missing dates sort last; the row index keeps the sort stable and
+        # avoids comparing datetimes with anything else.
+        dated = [isinstance(value, datetime) for value in added_col]
+        order = sorted(
+            range(n_rows),
+            key=lambda i: (not dated[i], added_col[i] if dated[i] else None, i),
+        )
+        labels = [value.isoformat() if isinstance(value, datetime) else None for value in added_col]
+    x_values: List[object] = [
+        labels[i] if labels[i] is not None else idx for idx, i in enumerate(order, start=1)
+    ]
+    y_valence, has_valence = _ordered_series(columns, "valence", order)
+    y_energy, has_energy = _ordered_series(columns, "energy", order)
 
     traces = []
-    y_valence = [row.get("valence") if isinstance(row.get("valence"), (int, float)) else None for row in sorted_rows]
-    if any(v is not None for v in y_valence):
+    if has_valence:
+        x_series, y_series = _timeline_series(x_values, y_valence)
         traces.append({
             "type": "scatter",
             "mode": "lines+markers",
             "name": "Valence",
-            "x": x_values,
-            "y": [v if v is not None else None for v in y_valence],
+            "x": x_series,
+            "y": y_series,
         })
-    y_energy = [row.get("energy") if isinstance(row.get("energy"), (int, float)) else None for row in sorted_rows]
-    if any(v is not None for v in y_energy):
+    if has_energy:
+        x_series, y_series = _timeline_series(x_values, y_energy)
         traces.append({
             "type": "scatter",
             "mode": "lines+markers",
             "name": "Energy",
-            "x": x_values,
-            "y": [v if v is not None else None for v in y_energy],
+            "x": x_series,
+            "y": y_series,
         })
 
     if not traces:
@@ -816,18 +1396,14 @@ def build_timeline_chart(rows: List[Dict[str, object]], include_cdn: bool) -> Op
         "margin": {"l": 40, "r": 40, "t": 60, "b": 40},
     }
 
-    return render_plotly_script("timeline", traces, layout, include_cdn)
+    return chart_spec("timeline", traces, layout)
 
 
-def build_top_artists_chart(rows: List[Dict[str, object]], include_cdn: bool) -> Optional[str]:
-    artists: Counter[str] = Counter()
-    for row in rows:
-        value = row.get("artist_name") or row.get("Artist Name(s)") or row.get("artist")
-        if value:
-            artists[str(value)] += 1
-    if not artists:
+def build_top_artists_chart(artist_counts: Mapping[str, int]) -> Optional[ChartSpec]:
+    if not len(artist_counts):
         return None
-    top = artists.most_common(10)
+    # nlargest keeps most_common's tie order without sorting every artist.
+    top = [(name, int(count)) for name, count in heapq.nlargest(10, artist_counts.items(), key=itemgetter(1))]
     layout = {
         "title": "Top artists",
         "margin": {"l": 160, "r": 40, "t": 60, "b": 60},
@@ -840,10 +1416,10 @@ def build_top_artists_chart(rows: List[Dict[str, object]], include_cdn: bool) ->
         "y": [name for name, _ in reversed(top)],
         "marker": {"color": "#6c63ff"},
     }]
-    return render_plotly_script("top-artists", data, layout, include_cdn)
+    return chart_spec("top-artists", data, layout)
 
 
-def build_audio_features_radar(summary: Dict[str, object], include_cdn: bool) -> Optional[str]:
+def build_audio_features_radar(summary: Dict[str, object]) -> Optional[ChartSpec]:
     audio_stats = summary.get("audio_features")
     if not isinstance(audio_stats, dict):
         return None
@@ -875,10 +1451,10 @@ def build_audio_features_radar(summary: Dict[str, object], include_cdn: bool) ->
         "polar": {"radialaxis": {"visible": True, "range": [0, 1]}},
         "margin": {"l": 60, "r": 60, "t": 60, "b": 40},
     }
-    return render_plotly_script("audio-radar", data, layout, include_cdn)
+    return chart_spec("audio-radar", data, layout)
 
 
-def render_dataset_page(result: DatasetResult, chart_html_blocks: Iterable[str]) -> str:
+def render_dataset_page(result: DatasetResult, chart_specs: Iterable[Optional[ChartSpec]]) -> Iterator[str]:
     meta = result.metadata
     date_range = meta.get("date_range")
     date_display = "—"
@@ -889,8 +1465,10 @@ def render_dataset_page(result: DatasetResult, chart_html_blocks: Iterable[str])
     zero_rows = ""
     if isinstance(zero_fraction, dict) and zero_fraction:
         zero_rows = "".join(
-            f"<tr><td>{feature.replace('_', ' ').title()}</td><td>{value:.2%}</td></tr>"
-            for feature, value in sorted(zero_fraction.items())
+            [
+                ZERO_FRACTION_ROW_TEMPLATE % (feature.replace("_", " ").title(), value * 100)
+                for feature, value in sorted(zero_fraction.items())
+            ]
         )
 
     recommendations = result.summary.get("recommendations")
@@ -900,10 +1478,6 @@ def render_dataset_page(result: DatasetResult, chart_html_blocks: Iterable[str])
             f"<li>{item}</li>" for item in recommendations
         ) + "</ul></div>"
 
-    charts_html = "".join(
-        f"<section class=\"chart-section card\">{block}</section>" for block in chart_html_blocks if block
-    )
-
     zero_fraction_html = (
         f"<div class=\"card\"><h3>Audio feature zero fractions</h3><table class=\"index-table\"><tbody>{zero_rows}</tbody></table></div>"
         if zero_rows
@@ -926,7 +1500,9 @@ def render_dataset_page(result: DatasetResult, chart_html_blocks: Iterable[str])
         else ""
     )
 
-    return f"""<!DOCTYPE html>
+    charts = [spec for spec in chart_specs if spec]
+
+    yield f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
     <meta charset=\"utf-8\" />
@@ -978,15 +1554,39 @@ def render_dataset_page(result: DatasetResult, chart_html_blocks: Iterable[str])
 
         {zero_fraction_html}
         {recommendations_list}
-        {charts_html}
+        """
+    for spec in charts:
+        yield CHART_SECTION_TEMPLATE % spec["id"]
+    yield f"""
     </main>
     {footer_html}
-</body>
+"""
+    if charts:
+        # Plotly and the shared loader are fetched once; the page only carries
+        # its own chart data, which is yielded on its own rather than being
+        # joined into a page-sized string.
+        payload = {spec["id"]: {"data": spec["data"], "layout": spec["layout"]} for spec in charts}
+        yield f"""    <script src=\"{PLOTLY_CDN_URL}\"></script>
+    <script src=\"assets/{CHARTS_JS_FILENAME}\"></script>
+    <script>window.__CHARTS__ = """
+        yield _dumps(payload)
+        yield """;
+    initCharts();</script>
+"""
+    yield """</body>
 </html>
 """
 
 
-def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
+def _count(value: object) -> int:
+    """Coerce a metadata count for the %d index row; missing or NaN counts are 0."""
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return 0
+
+
+def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> Iterator[str]:
     template_path = out_dir / TEMPLATE_DIRNAME / INDEX_TEMPLATE_FILENAME
     dataset_entries: List[Dict[str, object]] = []
     for result in results:
@@ -999,8 +1599,8 @@ def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
                 "name": result.name,
                 "href": result.page_href,
                 "summaryHref": result.summary_href,
-                "trackCount": int(meta.get("track_count", 0) or 0),
-                "uniqueArtists": int(meta.get("unique_artists", 0) or 0),
+                "trackCount": _count(meta.get("track_count")),
+                "uniqueArtists": _count(meta.get("unique_artists")),
                 "dateRange": {
                     "start": start or "—",
                     "end": end or "—",
@@ -1011,7 +1611,7 @@ def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
         )
 
     if template_path.exists():
-        dataset_json = json.dumps(dataset_entries, indent=2, ensure_ascii=False)
+        dataset_json = _dumps(dataset_entries, indent=True)
         dataset_count = len(results)
         context = {
             "dataset_json": dataset_json,
@@ -1020,17 +1620,12 @@ def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
             "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
         }
         template_text = template_path.read_text(encoding="utf-8")
-        return apply_index_template(template_text, context)
-
-    rows_html = "".join(
-        f"<tr><td><a href=\"{entry['href']}\">{entry['name']}</a></td>"
-        f"<td>{entry['trackCount']}</td>"
-        f"<td>{entry['uniqueArtists']}</td>"
-        f"<td>{entry['dateRange']['start']} → {entry['dateRange']['end']}</td>"
-        f"<td><a href=\"{entry['summaryHref']}\">summary</a></td></tr>"
-        for entry in dataset_entries
-    )
-    return f"""<!DOCTYPE html>
+        yield apply_index_template(template_text, context)
+        return
+
+    # Header, rows and footer are yielded separately so the table is never
+    # held in memory as one string.
+    yield f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
     <meta charset=\"utf-8\" />
@@ -1058,7 +1653,18 @@ def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
                 </tr>
             </thead>
             <tbody>
-                {rows_html}
+                """
+    for entry in dataset_entries:
+        yield INDEX_ROW_TEMPLATE % {
+            "href": html.escape(str(entry["href"])),
+            "name": html.escape(str(entry["name"])),
+            "trackCount": entry["trackCount"],
+            "uniqueArtists": entry["uniqueArtists"],
+            "start": html.escape(str(entry["dateRange"]["start"])),
+            "end": html.escape(str(entry["dateRange"]["end"])),
+            "summaryHref": html.escape(str(entry["summaryHref"])),
+        }
+    yield """
             </tbody>
         </table>
         <section class=\"card\">
@@ -1076,24 +1682,32 @@ def render_index_page(results: Sequence[DatasetResult], out_dir: Path) -> str:
 """
 
 
-def process_dataset(csv_path: Path, out_dir: Path, include_cdn: bool) -> DatasetResult:
-    rows, summary = pipeline_process(csv_path)
+def write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """Write rendered HTML chunks without joining them first."""
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.writelines(chunks)
+
+
+def process_dataset(csv_path: Path, out_dir: Path, chunksize: int = 0) -> DatasetResult:
+    columns, summary = pipeline_process(csv_path, chunksize)
 
     dataset_name = csv_path.stem.replace("_", " ").title()
     dataset_slug = slugify(csv_path.stem)
 
-    metadata = compute_metadata(rows, summary)
+    # The artist column is counted once and shared by the metadata and chart.
+    artist_counts = count_artists(columns)
+    metadata = compute_metadata(columns, summary, artist_counts)
 
     page_path = out_dir / f"{dataset_slug}.html"
     summary_path = out_dir / f"{dataset_slug}.summary.json"
 
     charts = [
-        build_timeline_chart(rows, include_cdn),
-        build_top_artists_chart(rows, False),
-        build_audio_features_radar(summary, False),
+        build_timeline_chart(columns),
+        build_top_artists_chart(artist_counts),
+        build_audio_features_radar(summary),
     ]
 
-    page_html = render_dataset_page(
+    page_chunks = render_dataset_page(
         DatasetResult(
             name=dataset_name,
             slug=dataset_slug,
@@ -1104,7 +1718,7 @@ def process_dataset(csv_path: Path, out_dir: Path, include_cdn: bool) -> Dataset
         ),
         charts,
     )
-    page_path.write_text(page_html, encoding="utf-8")
+    write_chunks(page_path, page_chunks)
 
     summary_payload = {
         "dataset": dataset_name,
@@ -1112,7 +1726,7 @@ def process_dataset(csv_path: Path, out_dir: Path, include_cdn: bool) -> Dataset
         "metadata": metadata,
         "summary": summary,
     }
-    summary_path.write_text(json.dumps(summary_payload, indent=2), encoding="utf-8")
+    _write_json(summary_path, summary_payload)
 
     logger.info("Generated %s and %s", page_path.name, summary_path.name)
 
@@ -1126,30 +1740,150 @@ def process_dataset(csv_path: Path, out_dir: Path, include_cdn: bool) -> Dataset
     )
 
 
+def _build_fingerprint() -> str:
+    """Hash the code and styles that shape every page, to invalidate the build cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b"pandas" if PIPELINE_AVAILABLE else b"fallback")
+    sources = [Path(__file__), STYLES_PY]
+    if PIPELINE_AVAILABLE:
+        sources += [CORE_DIR / "data_processor.py", CORE_DIR / "emotion_analyzer.py"]
+    for source in sources:
+        if source.exists():
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _csv_stamp(csv_path: Path) -> Dict[str, object]:
+    """Identify a CSV by content, so a touched but unchanged file stays cached."""
+    digest = hashlib.blake2b(digest_size=16)
+    with csv_path.open("rb") as handle:
+        for block in iter(functools.partial(handle.read, 1 << 20), b""):
+            digest.update(block)
+    return {"size": csv_path.stat().st_size, "blake2b": digest.hexdigest()}
+
+
+def _cache_key(csv_path: Path, input_root: Path) -> str:
+    """Key a CSV by its path under the input root, so the cache survives a change of cwd."""
+    resolved = csv_path.resolve()
+    try:
+        return resolved.relative_to(input_root).as_posix()
+    except ValueError:
+        # A symlink pointing outside the input root keeps its absolute target.
+        return resolved.as_posix()
+
+
+def load_build_cache(out_dir: Path, fingerprint: str) -> Dict[str, Dict[str, object]]:
+    cache_path = out_dir / BUILD_CACHE_FILENAME
+    if not cache_path.exists():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("fingerprint") != fingerprint:
+        return {}
+    datasets = cache.get("datasets")
+    return datasets if isinstance(datasets, dict) else {}
+
+
+def load_cached_result(
+    stamp: Dict[str, object], out_dir: Path, entry: object
+) -> Optional[DatasetResult]:
+    """Rebuild a DatasetResult from a previous run if the CSV content is unchanged."""
+    if not isinstance(entry, dict) or entry.get("stamp") != stamp:
+        return None
+    page_path = out_dir / str(entry.get("page"))
+    summary_path = out_dir / str(entry.get("summary"))
+    if not page_path.is_file() or not summary_path.is_file():
+        return None
+    try:
+        payload = json.loads(summary_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return DatasetResult(
+        name=payload["dataset"],
+        slug=page_path.stem,
+        page_path=page_path,
+        summary_path=summary_path,
+        metadata=payload["metadata"],
+        summary=payload["summary"],
+    )
+
+
 def main(argv: Optional[Sequence[str]] = None) -> None:
     args = parse_args(argv)
 
     csv_files = discover_csv_files(args.input_dir)
     assets_dir = prepare_output_directory(args.out_dir, force=args.force)
-    write_css(assets_dir)
-    copy_docs(args.out_dir)
-
-    results: List[DatasetResult] = []
-    include_cdn = True
+    # Static assets are plain file I/O, so they are written concurrently.
+    with ThreadPoolExecutor(max_workers=3) as io_executor:
+        io_futures = [
+            io_executor.submit(write_css, assets_dir),
+            io_executor.submit(write_charts_js, assets_dir),
+            io_executor.submit(copy_docs, args.out_dir),
+        ]
+        for io_future in io_futures:
+            io_future.result()
+
+    # Datasets whose CSV content is unchanged since the last build (with the
+    # same exporter code and styles) keep their existing page and summary.
+    fingerprint = _build_fingerprint()
+    build_cache = load_build_cache(args.out_dir, fingerprint)
+    stamps = {csv_path: _csv_stamp(csv_path) for csv_path in csv_files}
+    input_root = args.input_dir.resolve()
+    cache_keys = {csv_path: _cache_key(csv_path, input_root) for csv_path in csv_files}
+    completed: Dict[Path, DatasetResult] = {}
     for csv_path in csv_files:
-        try:
-            result = process_dataset(csv_path, args.out_dir, include_cdn)
-            include_cdn = False  # only include Plotly CDN script once per page set
-            results.append(result)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.error("Failed to process %s: %s", csv_path, exc)
+        cached = load_cached_result(stamps[csv_path], args.out_dir, build_cache.get(cache_keys[csv_path]))
+        if cached is not None:
+            logger.info("Skipping unchanged %s", csv_path.name)
+            completed[csv_path] = cached
+    stale = [csv_path for csv_path in csv_files if csv_path not in completed]
+
+    # Datasets are independent, so each one is built in its own worker process.
+    # With a single worker the pool's startup and pickling cost buys nothing.
+    max_workers = min(len(stale), args.jobs if args.jobs > 0 else os.cpu_count() or 1)
+    if max_workers == 1:
+        for csv_path in stale:
+            try:
+                completed[csv_path] = process_dataset(csv_path, args.out_dir, args.chunksize)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Failed to process %s: %s", csv_path, exc)
+    elif stale:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_dataset, csv_path, args.out_dir, args.chunksize): csv_path
+                for csv_path in stale
+            }
+            for future in as_completed(futures):
+                csv_path = futures[future]
+                try:
+                    completed[csv_path] = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.error("Failed to process %s: %s", csv_path, exc)
+    results = [completed[csv_path] for csv_path in csv_files if csv_path in completed]
 
     if not results:
         raise RuntimeError("No datasets were successfully processed.")
 
-    index_html = render_index_page(results, args.out_dir)
+    _write_json(
+        args.out_dir / BUILD_CACHE_FILENAME,
+        {
+            "fingerprint": fingerprint,
+            "datasets": {
+                cache_keys[csv_path]: {
+                    "stamp": stamps[csv_path],
+                    "page": completed[csv_path].page_path.name,
+                    "summary": completed[csv_path].summary_path.name,
+                }
+                for csv_path in csv_files
+                if csv_path in completed
+            },
+        },
+    )
+
     index_path = args.out_dir / "index.html"
-    index_path.write_text(index_html, encoding="utf-8")
+    write_chunks(index_path, render_index_page(results, args.out_dir))
     logger.info("Wrote index to %s", index_path)
 
 
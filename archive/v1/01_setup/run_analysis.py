@@ -13,8 +13,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "02_core"))
 
-from data_processor import load_exportify, clean, save_processed
-from pattern_analyzer import playlist_stats, repeat_obsessions, temporal_patterns
+from data_processor import load_exportify, clean, save_processed, load_processed
+from pattern_analyzer import name_counts, playlist_stats, repeat_obsessions, temporal_patterns
 from emotion_analyzer import add_spotify_audio_features, add_lyric_sentiment, compute_emotion_summary
 from visualizer import save_all_visualizations, create_emotion_summary_text
 from config import DATA_DIR_RAW, DATA_DIR_PROCESSED, PROJECT_ROOT
@@ -46,22 +46,28 @@ def main():
         csv_file = csv_files[0]
         print(f"Found CSV file: {csv_file.name}")
         
-        # Load and clean data
-        df_raw = load_exportify(csv_file)
-        print(f"Loaded {len(df_raw)} raw rows")
-        
-        df_clean = clean(df_raw)
-        print(f"Cleaned to {len(df_clean)} rows")
-        
-        # Save processed data
+        # Reuse processed data if the CSV is unchanged since it was saved
         processed_file = DATA_DIR_PROCESSED / f"{csv_file.stem}_processed.parquet"
-        save_processed(df_clean, processed_file)
-        print(f"Saved processed data to {processed_file}")
+        df_clean = load_processed(csv_file, processed_file)
+        if df_clean is not None:
+            print(f"Loaded {len(df_clean)} cleaned rows from {processed_file}")
+        else:
+            # Load and clean data
+            df_raw = load_exportify(csv_file)
+            print(f"Loaded {len(df_raw)} raw rows")
+            
+            df_clean = clean(df_raw)
+            print(f"Cleaned to {len(df_clean)} rows")
+            
+            # Save processed data
+            save_processed(df_clean, processed_file, source_csv=csv_file)
+            print(f"Saved processed data to {processed_file}")
         print()
         
         # Step 2: Basic statistics
         print("📊 STEP 2: Computing statistics...")
-        stats = playlist_stats(df_clean)
+        counts = name_counts(df_clean)
+        stats = playlist_stats(df_clean, counts=counts)
         
         print(f"Total tracks: {stats['total_tracks']}")
         print(f"Unique artists: {stats['unique_artists']}")
@@ -76,12 +82,12 @@ def main():
         
         # Step 3: Pattern analysis
         print("🔍 STEP 3: Analyzing patterns...")
-        obsessions_df = repeat_obsessions(df_clean, threshold=3)
+        obsessions_df = repeat_obsessions(df_clean, threshold=3, counts=counts)
         
         if len(obsessions_df) > 0:
             print(f"Found {len(obsessions_df)} obsessions:")
-            for _, row in obsessions_df.head(5).iterrows():
-                print(f"  - {row['type'].title()}: {row['name']} ({row['count']} times, {row['percentage']:.1f}%)")
+            for obs in obsessions_df.head(5).itertuples(index=False):
+                print(f"  - {obs.type.title()}: {obs.name} ({obs.count} times, {obs.percentage:.1f}%)")
         else:
             print("No repeat obsessions found")
         
@@ -0,0 +1,102 @@
+"""
+Regression tests for the static site exporter's fallback helpers.
+
+Run with: python -m pytest 01_setup/test_export_static_site.py
+"""
+import csv
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import export_static_site as ess  # noqa: E402
+
+
+def _write_short_row_csv(path: Path) -> Path:
+    path.write_text(
+        "Track Name,Artist Name(s),Added At,energy\n"
+        "First,Artist A,2023-01-01T10:00:00Z,0.5\n"
+        "Second,Artist B\n"
+        "Third,Artist C,2023-01-03T10:00:00Z,0.7\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _dict_reader_columns(path: Path) -> dict:
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+
+def test_csv_reader_pads_short_rows(tmp_path):
+    csv_path = _write_short_row_csv(tmp_path / "short.csv")
+    columns = next(ess._iter_csv_columns(csv_path))
+    assert columns == _dict_reader_columns(csv_path)
+    assert columns["energy"] == ["0.5", None, "0.7"]
+
+
+@pytest.mark.skipif(ess.pa_csv is None, reason="pyarrow not installed")
+def test_pyarrow_loader_falls_back_on_short_rows(tmp_path):
+    csv_path = _write_short_row_csv(tmp_path / "short.csv")
+    with pytest.raises(ess.pa.ArrowInvalid):
+        ess._pyarrow_load_exportify(csv_path)
+    assert ess.fallback_load_exportify(csv_path) == next(ess._iter_csv_columns(csv_path))
+
+
+def _reject_constant(token):
+    raise ValueError(f"non-standard JSON token {token}")
+
+
+@pytest.mark.skipif(ess.np is None, reason="numpy not installed")
+def test_json_writers_agree_on_nan(tmp_path, monkeypatch):
+    np = ess.np
+    payload = {
+        "mean": float("nan"),
+        "peak": np.float64("inf"),
+        "scale": np.float32("nan"),
+        "series": np.array([0.5, np.nan]),
+        "nested": [{"value": float("nan")}, (1, 2.5)],
+        "added": ess.datetime(2023, 1, 1, 10, tzinfo=ess.timezone.utc),
+    }
+    expected = {
+        "mean": None,
+        "peak": None,
+        "scale": None,
+        "series": [0.5, None],
+        "nested": [{"value": None}, [1, 2.5]],
+        "added": "2023-01-01T10:00:00+00:00",
+    }
+    path = tmp_path / "summary.json"
+    ess._write_json(path, payload)
+    outputs = [path.read_text(encoding="utf-8")]
+    if ess.orjson is not None:
+        outputs.append(ess._dumps(payload, indent=True))
+    monkeypatch.setattr(ess, "orjson", None)
+    outputs.append(ess._dumps(payload, indent=True))
+    for text in outputs:
+        assert ess.json.loads(text, parse_constant=_reject_constant) == expected
+
+
+def _timeline_labels(stamps):
+    columns = {"added_at": ess._parse_added_at(stamps), "valence": [0.1, 0.2]}
+    return ess.build_timeline_chart(columns)["data"][0]["x"]
+
+
+@pytest.mark.parametrize(
+    "stamps, labels",
+    [
+        (["2023-01-01T10:00:00Z", "2023-01-02T10:00:00Z"], ["2023-01-01T10:00:00+00:00", "2023-01-02T10:00:00+00:00"]),
+        (["2023-01-01T10:00:00", "2023-01-02T10:00:00"], ["2023-01-01T10:00:00", "2023-01-02T10:00:00"]),
+        (["2023-01-01T10:00:00+02:00", "2023-01-02T10:00:00+02:00"], ["2023-01-01T10:00:00+02:00", "2023-01-02T10:00:00+02:00"]),
+    ],
+)
+def test_timeline_labels_keep_source_offsets(stamps, labels, monkeypatch):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert _timeline_labels(stamps) == labels
+    monkeypatch.setattr(ess, "np", None)
+    assert _timeline_labels(stamps) == labels
@@ -23,6 +23,13 @@ DATA_DIR_PROCESSED.mkdir(parents=True, exist_ok=True)
 SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
 SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 
+# Local cache of analysis results: Spotify audio features keyed by track ID
+# and NRCLex emotion frequencies keyed by text, one table each
+ANALYSIS_CACHE_PATH = DATA_DIR_PROCESSED / "analysis_cache.sqlite"
+
+# Audio-feature batches requested from Spotify at the same time
+SPOTIFY_MAX_CONCURRENT_REQUESTS = int(os.getenv("SPOTIFY_MAX_CONCURRENT_REQUESTS", "10"))
+
 # Analysis settings
 DEFAULT_REPEAT_THRESHOLD = 10
 DEFAULT_TOP_N = 10
@@ -63,10 +70,12 @@ def get_config() -> Dict[str, Any]:
             "data_dir": DATA_DIR,
             "data_raw": DATA_DIR_RAW,
             "data_processed": DATA_DIR_PROCESSED,
+            "analysis_cache": ANALYSIS_CACHE_PATH,
         },
         "spotify": {
             "client_id": SPOTIFY_CLIENT_ID,
             "client_secret": SPOTIFY_CLIENT_SECRET,
+            "max_concurrent_requests": SPOTIFY_MAX_CONCURRENT_REQUESTS,
         },
         "analysis": {
             "repeat_threshold": DEFAULT_REPEAT_THRESHOLD,
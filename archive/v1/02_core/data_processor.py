@@ -4,6 +4,8 @@ Data processing module for Project Orpheus.
 Handles loading, cleaning, and validation of Exportify CSV files.
 See 🔍 How It Works, step 1 in README for data pipeline overview.
 """
+import codecs
+import csv
 import logging
 import pandas as pd
 import numpy as np
@@ -12,10 +14,86 @@ from typing import Optional, List, Dict, Any
 
 from config import EXPORTIFY_REQUIRED_COLUMNS, DATA_DIR_PROCESSED
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Arrow-backed strings keep text in contiguous UTF-8 buffers, so .str
+# methods such as strip() run as Arrow compute kernels
+TEXT_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+
+# Logging is configured by the entry points (run_analysis.py, the app)
 logger = logging.getLogger(__name__)
 
+# Accepted source names for each standard column, in order of preference
+ESSENTIAL_MAPPINGS = {
+    'track_name': ['Track Name', 'track_name', 'name', 'song'],
+    'artist_name': ['Artist Name(s)', 'artist_name', 'artist', 'Artist Name'],
+    'album_name': ['Album Name', 'album_name', 'album'],
+    'added_at': ['Added At', 'added_at', 'date_added', 'timestamp']
+}
+
+# Alias -> (standard name, preference rank), so clean() maps columns with
+# one lookup each
+_ALIAS_TO_STANDARD = {
+    alias: (standard_name, rank)
+    for standard_name, aliases in ESSENTIAL_MAPPINGS.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Raw columns read by the analyzers (playlist grouping, Spotify lookups)
+_AUXILIARY_COLUMNS = ['Playlist Name', 'playlist_name', 'playlist', 'Track URI', 'track_uri', 'uri']
+
+# Everything load_exportify keeps; other Exportify columns are never parsed
+_LOAD_COLUMNS = frozenset(EXPORTIFY_REQUIRED_COLUMNS).union(
+    _AUXILIARY_COLUMNS, *ESSENTIAL_MAPPINGS.values()
+)
+# Read as text; release dates stay strings since they may be year-only
+_TEXT_COLUMNS = frozenset(
+    ESSENTIAL_MAPPINGS['track_name']
+    + ESSENTIAL_MAPPINGS['artist_name']
+    + ESSENTIAL_MAPPINGS['album_name']
+    + ['Album Release Date']
+)
+
+# Nullable integer types for Exportify's numeric columns, so a blank cell
+# does not turn the whole column into float or object
+_NUMERIC_DTYPES = {
+    'Disc Number': 'Int32',
+    'Track Number': 'Int32',
+    'Track Duration (ms)': 'Int64',
+    'Popularity': 'Int32',
+}
+
+
+def _sniff_encoding(csv_path: Path, sample_size: int = 65536) -> str:
+    """
+    Pick the CSV encoding from a byte-order mark or a sample of the file.
+    
+    Args:
+        csv_path: Path to the CSV file
+        sample_size: Number of leading bytes to inspect
+        
+    Returns:
+        'utf-8-sig' or 'utf-16' for files with a BOM, 'utf-8' if the sample
+        decodes as UTF-8, otherwise 'latin-1'
+    """
+    with open(csv_path, 'rb') as handle:
+        sample = handle.read(sample_size)
+    
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        # Incremental decoding tolerates a multi-byte character cut off at the end
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return 'latin-1'
+    return 'utf-8'
+
 
 def load_exportify(csv_path: Path) -> pd.DataFrame:
     """
@@ -32,36 +110,55 @@ def load_exportify(csv_path: Path) -> pd.DataFrame:
         pd.errors.EmptyDataError: If CSV is empty
         pd.errors.ParserError: If CSV format is invalid
     """
-    logger.info(f"Loading Exportify CSV from: {csv_path}")
+    logger.info("Loading Exportify CSV from: %s", csv_path)
     
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
     
-    def _read_csv_with_chunks(encoding: str) -> pd.DataFrame:
-        """Helper to read CSV files in manageable chunks."""
-
-        try:
-            chunk_reader = pd.read_csv(
-                csv_path,
-                encoding=encoding,
-                chunksize=5000,
-                low_memory=False
-            )
-            chunks = list(chunk_reader)
-            if not chunks:
-                return pd.DataFrame()
-            return pd.concat(chunks, ignore_index=True)
-        except ValueError:
-            # Fallback for engines that don't support chunking
-            return pd.read_csv(csv_path, encoding=encoding, low_memory=False)
+    def _read_header(encoding: str) -> List[str]:
+        """Return the CSV header row (empty for an empty file)."""
+        with open(csv_path, newline='', encoding=encoding) as handle:
+            return next(csv.reader(handle), [])
+
+    def _read_csv(encoding: str) -> pd.DataFrame:
+        """Read only the used columns, with text and date types set up front."""
+        header = _read_header(encoding)
+        if not header:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        usecols = [col for col in header if col in _LOAD_COLUMNS]
+        dtype = {col: TEXT_DTYPE for col in usecols if col in _TEXT_COLUMNS}
+        dtype.update({col: kind for col, kind in _NUMERIC_DTYPES.items() if col in usecols})
+        parse_dates = [col for col in ESSENTIAL_MAPPINGS['added_at'] if col in usecols][:1]
+        options = dict(encoding=encoding, usecols=usecols, dtype=dtype, parse_dates=parse_dates)
+
+        if PYARROW_AVAILABLE:
+            try:
+                # Multi-threaded Arrow parser; it does not support chunking
+                return pd.read_csv(csv_path, engine='pyarrow', **options)
+            except (ValueError, TypeError) as e:
+                logger.debug("pyarrow CSV engine failed (%s); using the C parser", e)
+
+        chunk_reader = pd.read_csv(
+            csv_path, engine='c', memory_map=True, chunksize=5000, low_memory=False, **options
+        )
+        chunks = list(chunk_reader)
+        if not chunks:
+            return pd.DataFrame(columns=usecols)
+        return pd.concat(chunks, ignore_index=True)
 
+    # The encoding is chosen up front so a non-UTF-8 file is parsed once;
+    # the latin-1 retry only covers bad bytes past the sampled prefix
+    encoding = _sniff_encoding(csv_path)
+    if encoding == 'latin-1':
+        logger.warning("CSV is not UTF-8 encoded, reading as latin-1")
     try:
-        df = _read_csv_with_chunks('utf-8')
+        df = _read_csv(encoding)
     except UnicodeDecodeError:
         logger.warning("UTF-8 encoding failed, trying latin-1")
-        df = _read_csv_with_chunks('latin-1')
+        df = _read_csv('latin-1')
     
-    logger.info(f"Successfully loaded {len(df)} rows from {csv_path.name}")
+    logger.info("Successfully loaded %s rows from %s", len(df), csv_path.name)
     return df
 
 
@@ -83,87 +180,143 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Starting data cleaning process")
     
-    # Create a copy to avoid modifying original
-    df_clean = df.copy()
-    
-    # Validate required columns (flexible matching)
-    available_columns = set(df_clean.columns)
-    
-    # Check for essential columns (flexible naming)
-    essential_mappings = {
-        'track_name': ['Track Name', 'track_name', 'name', 'song'],
-        'artist_name': ['Artist Name(s)', 'artist_name', 'artist', 'Artist Name'],
-        'album_name': ['Album Name', 'album_name', 'album'],
-        'added_at': ['Added At', 'added_at', 'date_added', 'timestamp']
-    }
-    
-    # Map columns to standard names
-    column_mapping = {}
-    for standard_name, possible_names in essential_mappings.items():
-        for possible_name in possible_names:
-            if possible_name in available_columns:
-                column_mapping[possible_name] = standard_name
-                break
-    
-    # Rename columns
-    df_clean = df_clean.rename(columns=column_mapping)
+    # Map columns to standard names (flexible naming); when several aliases
+    # of one standard name are present, the most preferred one wins
+    best_alias = {}
+    for col in df.columns:
+        match = _ALIAS_TO_STANDARD.get(col)
+        if match is not None:
+            standard_name, rank = match
+            if standard_name not in best_alias or rank < best_alias[standard_name][1]:
+                best_alias[standard_name] = (col, rank)
+    column_mapping = {col: standard_name for standard_name, (col, _) in best_alias.items()}
     
+    # Rename columns. rename() returns a new frame, so the caller's frame is
+    # never modified and no separate defensive copy is needed.
+    df_clean = df.rename(columns=column_mapping)
+
+    # Parse dates once here so every analyzer can use the .dt accessor
+    # directly. load_exportify already parses them, so typed input is kept;
+    # anything else is coerced to UTC, which also keeps mixed offsets from
+    # falling back to an object column.
+    if 'added_at' in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean['added_at']):
+        df_clean['added_at'] = pd.to_datetime(df_clean['added_at'], errors='coerce', utc=True)
+
     # Data type coercion
     try:
-        # Parse dates
-        if 'added_at' in df_clean.columns:
-            df_clean['added_at'] = pd.to_datetime(df_clean['added_at'], errors='coerce')
-        
-        # Clean string columns
+        # Clean string columns. Text columns are stripped in place; only
+        # non-text columns (e.g. all-numeric titles) are converted first.
+        # Missing values stay missing so the essential-data filter drops them.
         string_cols = ['track_name', 'artist_name', 'album_name']
         for col in string_cols:
             if col in df_clean.columns:
-                df_clean[col] = df_clean[col].astype(str).str.strip()
+                if pd.api.types.is_string_dtype(df_clean[col]):
+                    df_clean[col] = df_clean[col].str.strip()
+                else:
+                    df_clean[col] = df_clean[col].astype(str).str.strip()
     
     except Exception as e:
-        logger.warning(f"Data type coercion failed: {e}")
+        logger.warning("Data type coercion failed: %s", e)
     
-    # Remove duplicates based on track and artist
-    initial_count = len(df_clean)
+    # Remove duplicates based on track and artist, then rows with missing
+    # essential data. Both steps only build boolean masks, so the frame is
+    # filtered once.
     if 'track_name' in df_clean.columns and 'artist_name' in df_clean.columns:
-        df_clean = df_clean.drop_duplicates(subset=['track_name', 'artist_name'], keep='first')
+        # One uint64 hash per row lets duplicated() use a single integer table
+        row_keys = pd.util.hash_pandas_object(df_clean[['track_name', 'artist_name']], index=False)
+        keep = ~row_keys.duplicated(keep='first')
     else:
-        df_clean = df_clean.drop_duplicates()
+        keep = ~df_clean.duplicated()
     
-    duplicates_removed = initial_count - len(df_clean)
+    duplicates_removed = int((~keep).sum())
     if duplicates_removed > 0:
-        logger.info(f"Removed {duplicates_removed} duplicate rows")
+        logger.info("Removed %s duplicate rows", duplicates_removed)
     
-    # Remove rows with missing essential data
     essential_cols = ['track_name', 'artist_name']
     for col in essential_cols:
         if col in df_clean.columns:
-            initial_len = len(df_clean)
-            df_clean = df_clean[df_clean[col].notna() & (df_clean[col] != '')]
-            removed = initial_len - len(df_clean)
+            present = df_clean[col].notna() & (df_clean[col] != '')
+            removed = int((keep & ~present).sum())
+            keep &= present
             if removed > 0:
-                logger.info(f"Removed {removed} rows with missing {col}")
+                logger.info("Removed %s rows with missing %s", removed, col)
+    df_clean = df_clean[keep.to_numpy(dtype=bool)]
+    
+    # Dictionary-encode the repetitive text columns once for the downstream
+    # counts and group-bys. Categories follow first appearance, so ties in
+    # value_counts() keep the same order as with plain strings.
+    categorical_cols = {
+        col: pd.Categorical(df_clean[col], categories=pd.unique(df_clean[col].dropna()))
+        for col in ('artist_name', 'album_name', 'track_name')
+        if col in df_clean.columns
+    }
+    df_clean = df_clean.assign(**categorical_cols)
     
-    logger.info(f"Data cleaning complete. Final dataset: {len(df_clean)} rows")
+    logger.info("Data cleaning complete. Final dataset: %s rows", len(df_clean))
     return df_clean
 
 
-def save_processed(df: pd.DataFrame, out_path: Path) -> None:
+def _source_stamp(csv_path: Path) -> str:
+    """Identify a source CSV version by modification time and size."""
+    stat = csv_path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _marker_path(out_path: Path) -> Path:
+    return out_path.with_suffix('.clean_marker')
+
+
+def save_processed(df: pd.DataFrame, out_path: Path, source_csv: Optional[Path] = None) -> None:
     """
     Save processed DataFrame to parquet format.
     
     Args:
         df: Cleaned DataFrame from clean()
         out_path: Path where processed data should be saved
+        source_csv: CSV the data was cleaned from; when given, a marker is
+            written so load_processed() can reuse the parquet file
     """
-    logger.info(f"Saving processed data to: {out_path}")
+    logger.info("Saving processed data to: %s", out_path)
     
     # Ensure output directory exists
     out_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Save as parquet for efficient storage and fast loading
-    df.to_parquet(out_path, engine='pyarrow', index=False)
-    logger.info(f"Successfully saved {len(df)} rows to {out_path}")
+    # Save as parquet for efficient storage and fast loading. ZSTD level 3
+    # with dictionary encoding suits the repetitive artist/album text.
+    df.to_parquet(
+        out_path,
+        engine='pyarrow',
+        index=False,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=True,
+        row_group_size=64 * 1024
+    )
+    if source_csv is not None:
+        _marker_path(out_path).write_text(_source_stamp(source_csv), encoding='utf-8')
+    logger.info("Successfully saved %s rows to %s", len(df), out_path)
+
+
+def load_processed(csv_path: Path, out_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Load a cleaned DataFrame saved from csv_path, if it is still current.
+    
+    Args:
+        csv_path: Source Exportify CSV file
+        out_path: Parquet path previously passed to save_processed()
+        
+    Returns:
+        The cleaned DataFrame, or None if the CSV changed since it was saved
+        (or nothing was saved), in which case load_exportify() + clean() apply
+    """
+    marker_path = _marker_path(out_path)
+    if not out_path.exists() or not marker_path.exists():
+        return None
+    if marker_path.read_text(encoding='utf-8') != _source_stamp(csv_path):
+        return None
+    
+    logger.info("Loading processed data from: %s", out_path)
+    return pd.read_parquet(out_path, engine='pyarrow')
 
 
 def validate_exportify_schema(df: pd.DataFrame) -> Dict[str, Any]:
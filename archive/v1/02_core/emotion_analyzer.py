@@ -6,10 +6,13 @@ and text processing libraries. See 🔍 How It Works, step 3 in README
 for emotional mapping methodology.
 """
 import logging
+import sqlite3
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Any, Optional, TYPE_CHECKING
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
@@ -46,7 +49,28 @@ if TYPE_CHECKING:
     except ImportError:
         pass
 
-from config import SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET
+from config import (
+    ANALYSIS_CACHE_PATH,
+    SPOTIFY_CLIENT_ID,
+    SPOTIFY_CLIENT_SECRET,
+    SPOTIFY_MAX_CONCURRENT_REQUESTS,
+)
+
+SPOTIFY_AUDIO_FEATURES = [
+    'valence', 'energy', 'danceability', 'acousticness',
+    'instrumentalness', 'liveness', 'speechiness', 'tempo'
+]
+
+# NRCLex affect frequencies kept as emotion_* columns
+NRCLEX_EMOTIONS = ['joy', 'sadness', 'anger', 'fear']
+
+# Histogram edges for the sentiment distribution: negative < -0.1,
+# neutral in [-0.1, 0.1], positive > 0.1 (histogram bins are half-open, so
+# the upper neutral edge is the float just above 0.1)
+_SENTIMENT_BINS = np.array([-np.inf, -0.1, np.nextafter(0.1, np.inf), np.inf])
+
+# SQLite's default limit on bound parameters is 999
+_CACHE_QUERY_CHUNK = 500
 
 
 def _get_spotify_client() -> Optional["spotipy.Spotify"]:
@@ -74,6 +98,107 @@ def _get_spotify_client() -> Optional["spotipy.Spotify"]:
         return None
 
 
+def _connect_analysis_cache() -> sqlite3.Connection:
+    conn = sqlite3.connect(ANALYSIS_CACHE_PATH)
+    columns = ", ".join(f"{feature} REAL" for feature in SPOTIFY_AUDIO_FEATURES)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS audio_features (track_id TEXT PRIMARY KEY, {columns})")
+    columns = ", ".join(f"{emotion} REAL" for emotion in NRCLEX_EMOTIONS)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS lyric_emotions (text TEXT PRIMARY KEY, {columns})")
+    return conn
+
+
+def _load_cached_features(track_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up previously fetched audio features.
+    
+    Args:
+        track_ids: Spotify track IDs
+        
+    Returns:
+        Mapping of track ID to feature values for the IDs found in the cache
+    """
+    ids = list(track_ids)
+    if not ids or not ANALYSIS_CACHE_PATH.exists():
+        return {}
+    
+    query = f"SELECT track_id, {', '.join(SPOTIFY_AUDIO_FEATURES)} FROM audio_features WHERE track_id IN "
+    rows = []
+    try:
+        with closing(_connect_analysis_cache()) as conn:
+            for start in range(0, len(ids), _CACHE_QUERY_CHUNK):
+                chunk = ids[start:start+_CACHE_QUERY_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(conn.execute(f"{query}({placeholders})", chunk).fetchall())
+    except sqlite3.Error as e:
+        logger.warning(f"Audio feature cache unavailable: {e}")
+        return {}
+    
+    return {row[0]: dict(zip(SPOTIFY_AUDIO_FEATURES, row[1:])) for row in rows}
+
+
+def _store_cached_features(features_by_id: Dict[str, Dict[str, Any]]) -> None:
+    """Save fetched audio features so later runs can skip the API."""
+    if not features_by_id:
+        return
+    
+    placeholders = ", ".join("?" * (len(SPOTIFY_AUDIO_FEATURES) + 1))
+    rows = [
+        [track_id] + [feature_data.get(feature) for feature in SPOTIFY_AUDIO_FEATURES]
+        for track_id, feature_data in features_by_id.items()
+    ]
+    try:
+        with closing(_connect_analysis_cache()) as conn, conn:
+            conn.executemany(f"INSERT OR REPLACE INTO audio_features VALUES ({placeholders})", rows)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not update audio feature cache: {e}")
+
+
+def _load_cached_emotions(texts: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up previously computed NRCLex emotion frequencies.
+    
+    Args:
+        texts: Texts passed to NRCLex
+        
+    Returns:
+        Mapping of text to emotion frequencies for the texts found in the cache
+    """
+    texts = list(texts)
+    if not texts or not ANALYSIS_CACHE_PATH.exists():
+        return {}
+    
+    query = f"SELECT text, {', '.join(NRCLEX_EMOTIONS)} FROM lyric_emotions WHERE text IN "
+    rows = []
+    try:
+        with closing(_connect_analysis_cache()) as conn:
+            for start in range(0, len(texts), _CACHE_QUERY_CHUNK):
+                chunk = texts[start:start+_CACHE_QUERY_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(conn.execute(f"{query}({placeholders})", chunk).fetchall())
+    except sqlite3.Error as e:
+        logger.warning(f"Emotion cache unavailable: {e}")
+        return {}
+    
+    return {row[0]: dict(zip(NRCLEX_EMOTIONS, row[1:])) for row in rows}
+
+
+def _store_cached_emotions(emotions_by_text: Dict[str, Dict[str, Any]]) -> None:
+    """Save NRCLex emotion frequencies so later runs can skip the analysis."""
+    if not emotions_by_text:
+        return
+    
+    placeholders = ", ".join("?" * (len(NRCLEX_EMOTIONS) + 1))
+    rows = [
+        [text] + [emotions[emotion] for emotion in NRCLEX_EMOTIONS]
+        for text, emotions in emotions_by_text.items()
+    ]
+    try:
+        with closing(_connect_analysis_cache()) as conn, conn:
+            conn.executemany(f"INSERT OR REPLACE INTO lyric_emotions VALUES ({placeholders})", rows)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not update emotion cache: {e}")
+
+
 def add_spotify_audio_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add Spotify audio features to DataFrame.
@@ -89,14 +214,12 @@ def add_spotify_audio_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Adding Spotify audio features")
     
-    # Create copy to avoid modifying original
-    df_with_features = df.copy()
+    # Shallow copy: only whole columns are assigned below, which replaces
+    # them in the copy and leaves the caller's frame and data untouched
+    df_with_features = df.copy(deep=False)
     
     # Initialize audio feature columns
-    audio_features = [
-        'valence', 'energy', 'danceability', 'acousticness',
-        'instrumentalness', 'liveness', 'speechiness', 'tempo'
-    ]
+    audio_features = SPOTIFY_AUDIO_FEATURES
     
     for feature in audio_features:
         df_with_features[feature] = np.nan
@@ -145,33 +268,63 @@ def add_spotify_audio_features(df: pd.DataFrame) -> pd.DataFrame:
         else:
             track_ids.append(None)
     
-    # Fetch audio features in batches
+    # Features fetched on earlier runs come from the local cache; only the
+    # remaining unique IDs are requested from Spotify
+    known_features = _load_cached_features(set(id for id in track_ids if id is not None))
+    missing_ids = list(dict.fromkeys(
+        id for id in track_ids if id is not None and id not in known_features
+    ))
+    if known_features:
+        logger.info(f"Loaded cached audio features for {len(known_features)} tracks")
+    
+    # Fetch audio features in batches. Requests are network-bound, so several
+    # batches are in flight at once; results are applied in batch order.
     batch_size = 50  # Spotify API limit
-    for i in range(0, len(track_ids), batch_size):
-        batch_ids = [id for id in track_ids[i:i+batch_size] if id is not None]
-        
-        if not batch_ids:
-            continue
+    batches = [missing_ids[i:i+batch_size] for i in range(0, len(missing_ids), batch_size)]
+    fetched_features = {}
+    
+    if batches:
+        max_workers = max(1, min(SPOTIFY_MAX_CONCURRENT_REQUESTS, len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(spotify_client.audio_features, batch_ids) for batch_ids in batches]
         
-        try:
-            features = spotify_client.audio_features(batch_ids)
-            
-            # Map features back to DataFrame
-            for j, feature_data in enumerate(features):
+        for batch_number, (batch_ids, future) in enumerate(zip(batches, futures), start=1):
+            try:
+                features = future.result() or []
+            except Exception as e:
+                logger.error(f"Error fetching audio features for batch {batch_number}: {e}")
+                continue
+            for track_id, feature_data in zip(batch_ids, features):
                 if feature_data is not None:
-                    idx = i + j
-                    for feature in audio_features:
-                        df_with_features.loc[idx, feature] = feature_data.get(feature)
-            
-        except Exception as e:
-            logger.error(f"Error fetching audio features for batch {i//batch_size + 1}: {e}")
-            continue
+                    fetched_features[track_id] = {
+                        feature: feature_data.get(feature) for feature in audio_features
+                    }
+    
+    _store_cached_features(fetched_features)
+    known_features.update(fetched_features)
+    
+    # Map features back to DataFrame, row by position, in one assignment
+    feature_frame = pd.DataFrame(
+        [known_features.get(track_id, {}) for track_id in track_ids],
+        columns=audio_features,
+        index=df_with_features.index,
+        dtype=float
+    )
+    df_with_features[audio_features] = feature_frame
     
     feature_count = df_with_features['valence'].notna().sum()
     logger.info(f"Successfully added audio features for {feature_count} tracks")
     return df_with_features
 
 
+def _text_column(df: pd.DataFrame, names: List[str]) -> pd.Series:
+    """Return the first of ``names`` present in ``df`` as strings ('' if missing)."""
+    for name in names:
+        if name in df.columns:
+            return df[name].astype(object).fillna('').astype(str)
+    return pd.Series('', index=df.index, dtype=object)
+
+
 def add_lyric_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add lyric sentiment analysis to DataFrame.
@@ -187,7 +340,8 @@ def add_lyric_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Adding lyric sentiment analysis")
     
-    df_with_sentiment = df.copy()
+    # Shallow copy, as in add_spotify_audio_features
+    df_with_sentiment = df.copy(deep=False)
     
     # Initialize sentiment columns
     sentiment_cols = [
@@ -213,30 +367,43 @@ def add_lyric_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     
     # Mock lyric sentiment based on track/artist names
     # In a real implementation, this would fetch and analyze actual lyrics
-    for idx, row in df_with_sentiment.iterrows():
-        track_name = row.get('track_name', '') or row.get('Track Name', '')
-        artist_name = row.get('artist_name', '') or row.get('Artist Name(s)', '')
-        
-        # Create mock lyric text from track/artist names
-        mock_lyric = f"{track_name} {artist_name}".lower()
-        
+    track_names = _text_column(df_with_sentiment, ['track_name', 'Track Name'])
+    artist_names = _text_column(df_with_sentiment, ['artist_name', 'Artist Name(s)'])
+    mock_lyrics = (track_names + ' ' + artist_names).str.lower()
+    
+    # Each distinct text is analyzed once; repeats are filled in by map().
+    # NRCLex results are also cached across runs.
+    unique_lyrics = mock_lyrics.unique()
+    scores = {col: {} for col in sentiment_cols}
+    cached_emotions = _load_cached_emotions(unique_lyrics) if NRCLEX_AVAILABLE else {}
+    new_emotions = {}
+    for mock_lyric in unique_lyrics:
         if TEXTBLOB_AVAILABLE:
             try:
                 blob = TextBlob(mock_lyric)
-                df_with_sentiment.loc[idx, 'lyric_polarity'] = blob.sentiment.polarity
-                df_with_sentiment.loc[idx, 'lyric_subjectivity'] = blob.sentiment.subjectivity
+                scores['lyric_polarity'][mock_lyric] = blob.sentiment.polarity
+                scores['lyric_subjectivity'][mock_lyric] = blob.sentiment.subjectivity
             except Exception as e:
-                logger.debug(f"TextBlob error for row {idx}: {e}")
+                logger.debug(f"TextBlob error for '{mock_lyric}': {e}")
         
         if NRCLEX_AVAILABLE:
-            try:
-                emotion = NRCLex(mock_lyric)
-                df_with_sentiment.loc[idx, 'emotion_joy'] = emotion.affect_frequencies.get('joy', 0)
-                df_with_sentiment.loc[idx, 'emotion_sadness'] = emotion.affect_frequencies.get('sadness', 0)
-                df_with_sentiment.loc[idx, 'emotion_anger'] = emotion.affect_frequencies.get('anger', 0)
-                df_with_sentiment.loc[idx, 'emotion_fear'] = emotion.affect_frequencies.get('fear', 0)
-            except Exception as e:
-                logger.debug(f"NRCLex error for row {idx}: {e}")
+            emotions = cached_emotions.get(mock_lyric)
+            if emotions is None:
+                try:
+                    frequencies = NRCLex(mock_lyric).affect_frequencies
+                except Exception as e:
+                    logger.debug(f"NRCLex error for '{mock_lyric}': {e}")
+                    continue
+                emotions = {emotion: frequencies.get(emotion, 0) for emotion in NRCLEX_EMOTIONS}
+                new_emotions[mock_lyric] = emotions
+            for emotion, value in emotions.items():
+                scores[f'emotion_{emotion}'][mock_lyric] = value
+    
+    _store_cached_emotions(new_emotions)
+    
+    for col, values in scores.items():
+        if values:
+            df_with_sentiment[col] = mock_lyrics.map(values).astype(float)
     
     logger.info("Lyric sentiment analysis complete")
     return df_with_sentiment
@@ -263,46 +430,51 @@ def compute_emotion_summary(df: pd.DataFrame) -> Dict[str, Any]:
 
     # Audio feature statistics
     audio_features = ['valence', 'energy', 'danceability', 'acousticness', 'instrumentalness', 'liveness']
-    for feature in audio_features:
-        if feature in df.columns:
-            values = df[feature].dropna()
-            if len(values) > 0:
-                # handle zero-heavy columns by reporting zero fraction
-                zero_frac = float((values == 0).sum()) / float(len(values))
-                summary['audio_features'][feature] = {
-                    'mean': float(values.mean()),
-                    'std': float(values.std()),
-                    'min': float(values.min()),
-                    'max': float(values.max()),
-                    'median': float(values.median()),
-                    'count': int(len(values)),
-                    'zero_fraction': zero_frac,
-                }
+    present_features = [feature for feature in audio_features if feature in df.columns]
+    # One reduction over all feature columns instead of a pass per statistic
+    if present_features:
+        feature_stats = df[present_features].agg(['mean', 'std', 'min', 'max', 'median', 'count'])
+        zero_counts = (df[present_features] == 0).sum()
+    for feature in present_features:
+        count = int(feature_stats.at['count', feature])
+        if count > 0:
+            # handle zero-heavy columns by reporting zero fraction
+            zero_frac = float(zero_counts[feature]) / float(count)
+            summary['audio_features'][feature] = {
+                'mean': float(feature_stats.at['mean', feature]),
+                'std': float(feature_stats.at['std', feature]),
+                'min': float(feature_stats.at['min', feature]),
+                'max': float(feature_stats.at['max', feature]),
+                'median': float(feature_stats.at['median', feature]),
+                'count': count,
+                'zero_fraction': zero_frac,
+            }
 
-                # compute a simple rolling trend (7-day if added_at exists, else index-based 10)
-                if 'added_at' in df.columns and not df['added_at'].isna().all():
-                    try:
-                        temp = df[['added_at', feature]].dropna().sort_values('added_at')
-                        temp = temp.set_index('added_at')
-                        rolling = temp[feature].rolling('7D').mean().dropna()
-                        if len(rolling) >= 2:
-                            trend = float((rolling.iloc[-1] - rolling.iloc[0]))
-                        else:
-                            trend = 0.0
-                        summary['audio_features'][feature]['trend_7d'] = trend
-                    except Exception:
-                        summary['audio_features'][feature]['trend_7d'] = 0.0
-                else:
-                    # fallback simple index-based rolling mean
-                    try:
-                        rolling = values.rolling(window=min(10, max(1, len(values)))).mean().dropna()
-                        if len(rolling) >= 2:
-                            trend = float((rolling.iloc[-1] - rolling.iloc[0]))
-                        else:
-                            trend = 0.0
-                        summary['audio_features'][feature]['trend_index'] = trend
-                    except Exception:
-                        summary['audio_features'][feature]['trend_index'] = 0.0
+            # compute a simple rolling trend (7-day if added_at exists, else index-based 10)
+            if 'added_at' in df.columns and not df['added_at'].isna().all():
+                try:
+                    temp = df[['added_at', feature]].dropna().sort_values('added_at')
+                    temp = temp.set_index('added_at')
+                    rolling = temp[feature].rolling('7D').mean().dropna()
+                    if len(rolling) >= 2:
+                        trend = float((rolling.iloc[-1] - rolling.iloc[0]))
+                    else:
+                        trend = 0.0
+                    summary['audio_features'][feature]['trend_7d'] = trend
+                except Exception:
+                    summary['audio_features'][feature]['trend_7d'] = 0.0
+            else:
+                # fallback simple index-based rolling mean
+                try:
+                    values = df[feature].dropna()
+                    rolling = values.rolling(window=min(10, max(1, len(values)))).mean().dropna()
+                    if len(rolling) >= 2:
+                        trend = float((rolling.iloc[-1] - rolling.iloc[0]))
+                    else:
+                        trend = 0.0
+                    summary['audio_features'][feature]['trend_index'] = trend
+                except Exception:
+                    summary['audio_features'][feature]['trend_index'] = 0.0
 
     # Sentiment statistics
     sentiment_cols = ['lyric_polarity', 'lyric_subjectivity']
@@ -310,14 +482,15 @@ def compute_emotion_summary(df: pd.DataFrame) -> Dict[str, Any]:
         if col in df.columns:
             values = df[col].dropna()
             if len(values) > 0:
+                negative, neutral, positive = np.histogram(values.to_numpy(dtype=float), bins=_SENTIMENT_BINS)[0]
                 summary['sentiment'][col] = {
                     'mean': float(values.mean()),
                     'std': float(values.std()),
                     'count': int(len(values)),
                     'distribution': {
-                        'positive': int((values > 0.1).sum()),
-                        'negative': int((values < -0.1).sum()),
-                        'neutral': int(((values >= -0.1) & (values <= 0.1)).sum())
+                        'positive': int(positive),
+                        'negative': int(negative),
+                        'neutral': int(neutral)
                     }
                 }
 
@@ -46,12 +46,45 @@ def top_playlists(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     return playlist_counts
 
 
-def playlist_stats(df: pd.DataFrame) -> Dict[str, Any]:
+NAME_COLUMNS = ['artist_name', 'track_name', 'album_name']
+
+
+def name_counts(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Count occurrences of each artist, track and album name.
+    
+    Pass the result to playlist_stats() and repeat_obsessions() so both
+    reuse one set of value_counts() instead of recounting the columns.
+    
+    Args:
+        df: Processed DataFrame with music data
+        
+    Returns:
+        Dictionary mapping each name column present to its value counts
+    """
+    return {col: _observed_counts(df[col]) for col in NAME_COLUMNS if col in df.columns}
+
+
+def _observed_counts(series: pd.Series) -> pd.Series:
+    # Categorical columns list every category, including names absent from
+    # this frame (e.g. a filtered subset), with a zero count; drop those
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+
+def _value_counts(df: pd.DataFrame, col: str, counts: Optional[Dict[str, pd.Series]]) -> pd.Series:
+    if counts is not None and col in counts:
+        return counts[col]
+    return _observed_counts(df[col])
+
+
+def playlist_stats(df: pd.DataFrame, counts: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Any]:
     """
     Compute comprehensive playlist statistics.
     
     Args:
         df: Processed DataFrame with music data
+        counts: Precomputed name_counts(df), if available
         
     Returns:
         Dictionary with various playlist statistics
@@ -68,95 +101,81 @@ def playlist_stats(df: pd.DataFrame) -> Dict[str, Any]:
         'average_popularity': None
     }
     
-    # Artist statistics
+    # Artist statistics (counted once, only names present in df)
     if 'artist_name' in df.columns:
-        unique_artists = df['artist_name'].nunique()
+        artist_counts = _value_counts(df, 'artist_name', counts)
+        unique_artists = len(artist_counts)
         stats['unique_artists'] = unique_artists
-        most_common_artist = df['artist_name'].value_counts().index[0] if len(df) > 0 else None
+        most_common_artist = artist_counts.index[0] if len(artist_counts) > 0 else None
         stats['most_common_artist'] = most_common_artist
     
     # Album statistics
     if 'album_name' in df.columns:
-        unique_albums = df['album_name'].nunique()
+        album_counts = _value_counts(df, 'album_name', counts)
+        unique_albums = len(album_counts)
         stats['unique_albums'] = unique_albums
-        most_common_album = df['album_name'].value_counts().index[0] if len(df) > 0 else None
+        most_common_album = album_counts.index[0] if len(album_counts) > 0 else None
         stats['most_common_album'] = most_common_album
     
-    # Date range analysis
+    # Date range analysis (min/max skip missing dates, so no filtered copy
+    # is needed and each reduction runs once)
     if 'added_at' in df.columns:
-        date_series = df['added_at'].dropna()
-        if len(date_series) > 0:
+        earliest, latest = df['added_at'].agg(['min', 'max'])
+        if pd.notna(earliest):
             stats['date_range'] = {
-                'earliest': date_series.min(),
-                'latest': date_series.max(),
-                'span_days': (date_series.max() - date_series.min()).days
+                'earliest': earliest,
+                'latest': latest,
+                'span_days': (latest - earliest).days
             }
     
     # Popularity analysis
     popularity_cols = ['Popularity', 'popularity', 'play_count']
     for col in popularity_cols:
         if col in df.columns:
-            pop_values = df[col].dropna()
-            if len(pop_values) > 0:
-                stats['average_popularity'] = pop_values.mean()
+            pop_count, pop_mean = df[col].agg(['count', 'mean'])
+            if pop_count > 0:
+                stats['average_popularity'] = pop_mean
                 break
     
     logger.info(f"Statistics computed for {stats['total_tracks']} tracks")
     return stats
 
 
-def repeat_obsessions(df: pd.DataFrame, threshold: int = 10) -> pd.DataFrame:
+def repeat_obsessions(
+    df: pd.DataFrame,
+    threshold: int = 10,
+    counts: Optional[Dict[str, pd.Series]] = None
+) -> pd.DataFrame:
     """
     Detect repeat obsessions - artists/tracks that exceed play threshold.
     
     Args:
         df: Processed DataFrame with music data
         threshold: Minimum occurrence count to be considered an obsession
+        counts: Precomputed name_counts(df), if available
         
     Returns:
         DataFrame with obsession details (artist/track, count, type)
     """
     logger.info(f"Detecting repeat obsessions with threshold: {threshold}")
     
+    # Artist, track and album obsessions, each built column-wise from its
+    # value counts rather than one dict per name
     obsessions = []
-    
-    # Artist obsessions
-    if 'artist_name' in df.columns:
-        artist_counts = df['artist_name'].value_counts()
-        artist_obsessions = artist_counts[artist_counts >= threshold]
-        for artist, count in artist_obsessions.items():
-            obsessions.append({
-                'name': artist,
-                'count': count,
-                'type': 'artist',
-                'percentage': (count / len(df)) * 100
-            })
-    
-    # Track obsessions
-    if 'track_name' in df.columns:
-        track_counts = df['track_name'].value_counts()
-        track_obsessions = track_counts[track_counts >= threshold]
-        for track, count in track_obsessions.items():
-            obsessions.append({
-                'name': track,
-                'count': count,
-                'type': 'track',
-                'percentage': (count / len(df)) * 100
-            })
-    
-    # Album obsessions
-    if 'album_name' in df.columns:
-        album_counts = df['album_name'].value_counts()
-        album_obsessions = album_counts[album_counts >= threshold]
-        for album, count in album_obsessions.items():
-            obsessions.append({
-                'name': album,
-                'count': count,
-                'type': 'album',
-                'percentage': (count / len(df)) * 100
-            })
-    
-    obsessions_df = pd.DataFrame(obsessions)
+    for col, obsession_type in (('artist_name', 'artist'), ('track_name', 'track'), ('album_name', 'album')):
+        if col in df.columns:
+            col_counts = _value_counts(df, col, counts)
+            above = col_counts[col_counts >= threshold]
+            if len(above) > 0:
+                values = above.to_numpy()
+                obsessions.append(pd.DataFrame({
+                    'name': above.index.tolist(),
+                    'count': values,
+                    'type': obsession_type,
+                    'percentage': (values / len(df)) * 100
+                }))
+    
+    obsessions_df = pd.concat(obsessions, ignore_index=True) if obsessions else pd.DataFrame()
     
     if len(obsessions_df) > 0:
         obsessions_df = obsessions_df.sort_values('count', ascending=False)
@@ -190,21 +209,35 @@ def temporal_patterns(df: pd.DataFrame) -> Dict[str, Any]:
         logger.warning("No timestamp column found for temporal analysis")
         return patterns
     
-    # Filter valid dates
-    df_with_dates = df[df['added_at'].notna()].copy()
+    # Filter valid dates (only the timestamp column is needed, not a frame copy)
+    dates = df['added_at'].dropna()
     
-    if len(df_with_dates) == 0:
+    if len(dates) == 0:
         logger.warning("No valid dates found for temporal analysis")
         return patterns
     
-    # Monthly distribution
-    df_with_dates['month'] = df_with_dates['added_at'].dt.to_period('M')
-    monthly_counts = df_with_dates['month'].value_counts().sort_index()
+    # Monthly distribution, counted with bincount over integer month ordinals
+    # (months since 1970-01); only the months present become Period labels
+    month_ordinals = (dates.dt.year.to_numpy() - 1970) * 12 + dates.dt.month.to_numpy() - 1
+    first_ordinal = month_ordinals.min()
+    month_bins = np.bincount(month_ordinals - first_ordinal)
+    active = np.flatnonzero(month_bins)
+    monthly_counts = pd.Series(
+        month_bins[active],
+        index=pd.PeriodIndex([pd.Period(ordinal=int(o), freq='M') for o in active + first_ordinal], freq='M')
+    )
     patterns['monthly_distribution'] = monthly_counts.to_dict()
     
-    # Weekly distribution
-    df_with_dates['week'] = df_with_dates['added_at'].dt.to_period('W')
-    weekly_counts = df_with_dates['week'].value_counts().sort_index()
+    # Weekly distribution, counted the same way over week ordinals. Weeks run
+    # Monday to Sunday like to_period('W'), and 1970-01-05 was a Monday.
+    local_dates = dates.dt.tz_localize(None) if dates.dt.tz is not None else dates
+    day_numbers = local_dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+    week_ordinals = (day_numbers - 4) // 7
+    first_week = week_ordinals.min()
+    week_bins = np.bincount(week_ordinals - first_week)
+    active = np.flatnonzero(week_bins)
+    week_starts = pd.to_datetime((active + first_week) * 7 + 4, unit='D')
+    weekly_counts = pd.Series(week_bins[active], index=week_starts.to_period('W'))
     patterns['weekly_distribution'] = weekly_counts.to_dict()
     
     # Peak periods (months with highest activity)
@@ -5,8 +5,11 @@ Creates matplotlib charts and prepares data for Streamlit dashboard.
 Handles emotional timelines, pattern visualization, and mood mapping.
 """
 import logging
+from collections import Counter
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # charts are only saved or handed to Streamlit, never shown
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Any, Optional, Tuple
@@ -18,21 +21,45 @@ logger = logging.getLogger(__name__)
 plt.style.use('default')
 sns.set_palette("husl")
 
+# PNG export settings; zlib level 1 encodes the 300 dpi images much faster
+SAVE_OPTIONS = {'dpi': 300, 'bbox_inches': 'tight', 'pil_kwargs': {'compress_level': 1}}
 
-def plot_emotion_timeline(df: pd.DataFrame, save_path: Optional[Path] = None) -> plt.Figure:
+
+def _prepare_figure(fig: Optional[plt.Figure], figsize: Tuple[float, float]) -> plt.Figure:
+    """
+    Return ``fig`` cleared and resized for reuse, or a new figure if None.
+    
+    Figures use constrained layout, which is solved as part of drawing
+    instead of in a separate tight_layout() measuring pass.
+    """
+    if fig is None:
+        return plt.figure(figsize=figsize, layout='constrained')
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_layout_engine('constrained')
+    return fig
+
+
+def plot_emotion_timeline(
+    df: pd.DataFrame,
+    save_path: Optional[Path] = None,
+    fig: Optional[plt.Figure] = None
+) -> plt.Figure:
     """
     Create timeline visualization of emotional patterns.
     
     Args:
         df: DataFrame with temporal and emotion data
         save_path: Optional path to save the plot
+        fig: Optional existing figure to clear and draw into
         
     Returns:
         Matplotlib figure object
     """
     logger.info("Creating emotion timeline visualization")
     
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    fig = _prepare_figure(fig, (15, 10))
+    axes = fig.subplots(2, 2)
     fig.suptitle('Emotional Timeline - Project Orpheus', fontsize=16, fontweight='bold')
     
     # Check if we have temporal data
@@ -46,8 +73,10 @@ def plot_emotion_timeline(df: pd.DataFrame, save_path: Optional[Path] = None) ->
             'energy': np.random.uniform(0, 1, len(dates))
         })
     else:
-        df_temp = df[df['added_at'].notna()].copy()
-        df_temp = df_temp.sort_values('added_at')
+        # Only the plotted columns are taken, so the rest of the frame is
+        # never copied (boolean indexing and sort_values return new frames)
+        plot_cols = [col for col in ('added_at', 'valence', 'energy') if col in df.columns]
+        df_temp = df.loc[df['added_at'].notna(), plot_cols].sort_values('added_at')
     
     # Plot 1: Valence over time
     if 'valence' in df_temp.columns and not df_temp['valence'].isna().all():
@@ -95,8 +124,8 @@ def plot_emotion_timeline(df: pd.DataFrame, save_path: Optional[Path] = None) ->
     
     # Plot 4: Monthly listening activity
     if 'added_at' in df_temp.columns:
-        df_temp['month'] = df_temp['added_at'].dt.to_period('M')
-        monthly_counts = df_temp['month'].value_counts().sort_index()
+        # Months are sorted by sort_index, so value_counts need not sort by count
+        monthly_counts = df_temp['added_at'].dt.to_period('M').value_counts(sort=False).sort_index()
         if len(monthly_counts) > 0:
             axes[1, 1].bar(range(len(monthly_counts)), monthly_counts.values, alpha=0.7)
             axes[1, 1].set_title('Monthly Listening Activity')
@@ -112,16 +141,19 @@ def plot_emotion_timeline(df: pd.DataFrame, save_path: Optional[Path] = None) ->
                            ha='center', va='center', transform=axes[1, 1].transAxes)
             axes[1, 1].set_title('Monthly Listening Activity')
     
-    plt.tight_layout()
-    
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, **SAVE_OPTIONS)
         logger.info(f"Timeline visualization saved to {save_path}")
     
     return fig
 
 
-def plot_top_artists(df: pd.DataFrame, n: int = 10, save_path: Optional[Path] = None) -> plt.Figure:
+def plot_top_artists(
+    df: pd.DataFrame,
+    n: int = 10,
+    save_path: Optional[Path] = None,
+    fig: Optional[plt.Figure] = None
+) -> plt.Figure:
     """
     Create bar chart of top artists by track count.
     
@@ -129,13 +161,15 @@ def plot_top_artists(df: pd.DataFrame, n: int = 10, save_path: Optional[Path] =
         df: DataFrame with artist data
         n: Number of top artists to show
         save_path: Optional path to save the plot
+        fig: Optional existing figure to clear and draw into
         
     Returns:
         Matplotlib figure object
     """
     logger.info(f"Creating top {n} artists visualization")
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _prepare_figure(fig, (12, 8))
+    ax = fig.subplots()
     
     # Get artist counts
     artist_col = None
@@ -150,42 +184,47 @@ def plot_top_artists(df: pd.DataFrame, n: int = 10, save_path: Optional[Path] =
         ax.set_title('Top Artists')
         return fig
     
-    artist_counts = df[artist_col].value_counts().head(n)
+    # Counter has far less fixed overhead than value_counts() for playlist-sized
+    # columns; most_common keeps first-seen order among equal counts
+    top_artists = Counter(df[artist_col].dropna().tolist()).most_common(n)
     
-    if len(artist_counts) == 0:
+    if len(top_artists) == 0:
         ax.text(0.5, 0.5, 'No artist data available', 
                ha='center', va='center', transform=ax.transAxes)
         ax.set_title('Top Artists')
         return fig
     
     # Create horizontal bar chart
-    bars = ax.barh(range(len(artist_counts)), artist_counts.values, alpha=0.8)
-    ax.set_yticks(range(len(artist_counts)))
-    ax.set_yticklabels(artist_counts.index)
+    names = [name for name, _ in top_artists]
+    counts = [count for _, count in top_artists]
+    bars = ax.barh(range(len(counts)), counts, alpha=0.8)
+    ax.set_yticks(range(len(counts)))
+    ax.set_yticklabels(names)
     ax.set_xlabel('Track Count')
     ax.set_title(f'Top {n} Artists by Track Count')
     
     # Add value labels on bars
-    for i, (bar, count) in enumerate(zip(bars, artist_counts.values)):
-        ax.text(bar.get_width() + 0.1, bar.get_y() + bar.get_height()/2, 
-               str(count), va='center', ha='left')
-    
-    plt.tight_layout()
+    ax.bar_label(bars, labels=[str(count) for count in counts], padding=3)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, **SAVE_OPTIONS)
         logger.info(f"Top artists visualization saved to {save_path}")
     
     return fig
 
 
-def plot_audio_features_radar(df: pd.DataFrame, save_path: Optional[Path] = None) -> plt.Figure:
+def plot_audio_features_radar(
+    df: pd.DataFrame,
+    save_path: Optional[Path] = None,
+    fig: Optional[plt.Figure] = None
+) -> plt.Figure:
     """
     Create radar chart of average audio features.
     
     Args:
         df: DataFrame with audio feature data
         save_path: Optional path to save the plot
+        fig: Optional existing figure to clear and draw into
         
     Returns:
         Matplotlib figure object
@@ -202,14 +241,16 @@ def plot_audio_features_radar(df: pd.DataFrame, save_path: Optional[Path] = None
             feature_means[feature] = df[feature].mean()
     
     if not feature_means:
-        fig, ax = plt.subplots(figsize=(8, 8))
+        fig = _prepare_figure(fig, (8, 8))
+        ax = fig.subplots()
         ax.text(0.5, 0.5, 'No audio features available', 
                ha='center', va='center', transform=ax.transAxes)
         ax.set_title('Audio Features Profile')
         return fig
     
     # Create radar chart
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    fig = _prepare_figure(fig, (10, 10))
+    ax = fig.subplots(subplot_kw=dict(projection='polar'))
     
     features = list(feature_means.keys())
     values = list(feature_means.values())
@@ -231,7 +272,7 @@ def plot_audio_features_radar(df: pd.DataFrame, save_path: Optional[Path] = None
     ax.grid(True)
     
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, **SAVE_OPTIONS)
         logger.info(f"Audio features radar chart saved to {save_path}")
     
     return fig
@@ -307,23 +348,24 @@ def save_all_visualizations(df: pd.DataFrame, emotion_summary: Dict[str, Any],
     output_dir.mkdir(parents=True, exist_ok=True)
     saved_files = {}
     
+    # One figure is cleared and reused for every chart
+    fig = plt.figure()
+    
     # Timeline
     timeline_path = output_dir / "emotion_timeline.png"
-    plot_emotion_timeline(df, save_path=timeline_path)
+    plot_emotion_timeline(df, save_path=timeline_path, fig=fig)
     saved_files['timeline'] = timeline_path
-    plt.close()
     
     # Top artists
     artists_path = output_dir / "top_artists.png"
-    plot_top_artists(df, save_path=artists_path)
+    plot_top_artists(df, save_path=artists_path, fig=fig)
     saved_files['artists'] = artists_path
-    plt.close()
     
     # Audio features radar
     radar_path = output_dir / "audio_features_radar.png"
-    plot_audio_features_radar(df, save_path=radar_path)
+    plot_audio_features_radar(df, save_path=radar_path, fig=fig)
     saved_files['radar'] = radar_path
-    plt.close()
+    plt.close(fig)
     
     # Save text summary
     summary_path = output_dir / "emotion_summary.txt"
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
 
@@ -15,7 +16,12 @@ from emotion_analyzer import (
     add_lyric_sentiment,
     compute_emotion_summary,
 )
-from visualizer import create_emotion_summary_text
+from visualizer import (
+    create_emotion_summary_text,
+    plot_audio_features_radar,
+    plot_emotion_timeline,
+    plot_top_artists,
+)
 
 
 @st.cache_data(show_spinner=False)
@@ -48,9 +54,13 @@ def cached_repeat_obsessions(df: pd.DataFrame, threshold: int) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def cached_temporal_patterns(df: pd.DataFrame) -> dict[str, Any]:
-    """Analyze temporal patterns with caching."""
+    """Analyze temporal patterns with caching, including ready-to-plot series."""
 
-    return temporal_patterns(df)
+    patterns = temporal_patterns(df)
+    for name in ('monthly', 'weekly'):
+        distribution = patterns.get(f'{name}_distribution') or {}
+        patterns[f'{name}_series'] = pd.Series(distribution, dtype='int64').sort_index()
+    return patterns
 
 
 @st.cache_data(show_spinner=False)
@@ -79,3 +89,51 @@ def cached_emotion_summary_text(summary: dict[str, Any]) -> str:
     """Create the downloadable emotion summary text."""
 
     return create_emotion_summary_text(summary)
+
+
+def dataframe_key(df: pd.DataFrame) -> str:
+    """
+    Content hash identifying ``df`` for the figure caches below.
+
+    Computed once when a dataset is loaded and kept in session state; the
+    enriched frame is derived from it deterministically, so the same key
+    identifies it too.
+    """
+
+    return str(pd.util.hash_pandas_object(df, index=True).sum())
+
+
+# Figures are cached as resources rather than data: they are returned as the
+# same object on every rerun instead of being pickled, so callers must only
+# read them (st.pyplot just renders them). The frame itself is passed
+# unhashed (leading underscore) and identified by ``df_key``. Each figure is
+# closed in pyplot right away, so an entry evicted by max_entries is freed;
+# closed figures still render.
+FIGURE_CACHE_DATASETS = 4
+
+
+def _detached(fig: plt.Figure) -> plt.Figure:
+    plt.close(fig)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_DATASETS)
+def cached_timeline_figure(df_key: str, _df: pd.DataFrame) -> plt.Figure:
+    """Draw the emotion timeline once per dataset."""
+
+    return _detached(plot_emotion_timeline(_df))
+
+
+# One entry per artist count, and the slider offers 21 of them
+@st.cache_resource(show_spinner=False, max_entries=32)
+def cached_top_artists_figure(df_key: str, _df: pd.DataFrame, n: int) -> plt.Figure:
+    """Draw the top artists chart once per dataset and artist count."""
+
+    return _detached(plot_top_artists(_df, n=n))
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_DATASETS)
+def cached_audio_features_figure(df_key: str, _df: pd.DataFrame) -> plt.Figure:
+    """Draw the audio features radar once per dataset."""
+
+    return _detached(plot_audio_features_radar(_df))
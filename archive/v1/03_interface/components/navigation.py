@@ -18,17 +18,20 @@ NAV_ITEMS = {
 def render_sidebar(data_available: bool) -> Tuple[str, Optional[Any]]:
     """Render the sidebar with navigation and upload controls."""
 
-    st.sidebar.markdown("### 🎛️ Navigation")
-    nav_choice = st.sidebar.radio(
-        "Navigation",
-        options=list(NAV_ITEMS.keys()),
-        format_func=lambda key: NAV_ITEMS[key],
-        label_visibility="collapsed",
-        disabled=not data_available,
-        key="nav_choice",
-    )
+    # Navigation only exists once data is loaded; until then no (disabled)
+    # radio is built on each rerun and the app stays on the overview.
+    nav_choice = "Overview"
+    if data_available:
+        st.sidebar.markdown("### 🎛️ Navigation")
+        nav_choice = st.sidebar.radio(
+            "Navigation",
+            options=list(NAV_ITEMS.keys()),
+            format_func=lambda key: NAV_ITEMS[key],
+            label_visibility="collapsed",
+            key="nav_choice",
+        )
+        st.sidebar.markdown("---")
 
-    st.sidebar.markdown("---")
     st.sidebar.markdown("### 📁 Data Upload")
     uploaded_file = st.sidebar.file_uploader(
         "Upload Exportify CSV",
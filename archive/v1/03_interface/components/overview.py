@@ -38,13 +38,9 @@ def render_overview(df: pd.DataFrame, stats: Dict[str, object], *, is_sample: bo
     # Metrics row
     metric_cols = st.columns(4)
     total_tracks = stats.get('total_tracks') or len(df)
+    # playlist_stats already counted these; a zero count means no names
     unique_artists = stats.get('unique_artists')
-    if not unique_artists and 'artist_name' in df.columns:
-        unique_artists = df['artist_name'].nunique()
-
     unique_albums = stats.get('unique_albums')
-    if not unique_albums and 'album_name' in df.columns:
-        unique_albums = df['album_name'].nunique()
     avg_popularity = stats.get('average_popularity')
 
     with metric_cols[0]:
@@ -55,11 +55,10 @@ def render_patterns(
         temporal = load_temporal_patterns(df)
 
     temporal_cols = st.columns(2)
-    monthly_dist = temporal.get('monthly_distribution') or {}
-    weekly_dist = temporal.get('weekly_distribution') or {}
+    monthly_series = temporal.get('monthly_series')
+    weekly_series = temporal.get('weekly_series')
 
-    if monthly_dist:
-        monthly_series = pd.Series(monthly_dist).sort_index()
+    if monthly_series is not None and not monthly_series.empty:
         with temporal_cols[0]:
             st.markdown("**Monthly cadence**")
             st.bar_chart(monthly_series)
@@ -67,8 +66,7 @@ def render_patterns(
         with temporal_cols[0]:
             st.info("Add dates to your Exportify export to unlock monthly trends.")
 
-    if weekly_dist:
-        weekly_series = pd.Series(weekly_dist).sort_index()
+    if weekly_series is not None and not weekly_series.empty:
         with temporal_cols[1]:
             st.markdown("**Weekly cadence**")
             st.line_chart(weekly_series)
@@ -5,19 +5,20 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
-from visualizer import (
-    plot_emotion_timeline,
-    plot_top_artists,
-    plot_audio_features_radar,
-)
 from components.data_pipeline import (
     cached_add_spotify_audio_features,
+    cached_audio_features_figure,
     cached_compute_emotion_summary,
+    cached_timeline_figure,
+    cached_top_artists_figure,
 )
 
 
-def render_visualizations(df: pd.DataFrame) -> None:
-    """Render key visualizations for the dashboard."""
+def render_visualizations(df: pd.DataFrame, df_key: str) -> None:
+    """Render key visualizations for the dashboard.
+
+    ``df_key`` is the dataframe_key() of ``df``, computed when it was loaded.
+    """
 
     st.header("📈 Visual Narratives")
 
@@ -30,8 +31,9 @@ def render_visualizations(df: pd.DataFrame) -> None:
     with st.spinner("Computing emotion summary..."):
         _ = cached_compute_emotion_summary(df_enriched)
 
+    # Figures are drawn once per dataset and reused on later reruns
     with st.spinner("Painting your emotional timeline..."):
-        fig_timeline = plot_emotion_timeline(df_enriched)
+        fig_timeline = cached_timeline_figure(df_key, df_enriched)
     st.pyplot(fig_timeline, use_container_width=True)
 
     st.subheader("🎤 Top Artists")
@@ -43,10 +45,10 @@ def render_visualizations(df: pd.DataFrame) -> None:
         key="top_artists_slider",
     )
     with st.spinner("Highlighting your most played artists..."):
-        fig_artists = plot_top_artists(df_enriched, n=n_artists)
+        fig_artists = cached_top_artists_figure(df_key, df_enriched, n_artists)
     st.pyplot(fig_artists, use_container_width=True)
 
     st.subheader("🎵 Audio Features")
     with st.spinner("Mapping your sonic palette..."):
-        fig_radar = plot_audio_features_radar(df_enriched)
+        fig_radar = cached_audio_features_figure(df_key, df_enriched)
     st.pyplot(fig_radar, use_container_width=True)
@@ -53,6 +53,7 @@ from components.data_pipeline import (  # noqa: E402
     cached_playlist_stats,
     cached_repeat_obsessions,
     cached_temporal_patterns,
+    dataframe_key,
 )
 
 st.set_page_config(
@@ -135,6 +136,7 @@ def load_sample_data() -> None:
 
         # Persist processed data and schedule nav change for next run
         st.session_state.df_processed = df_clean
+        st.session_state.df_key = dataframe_key(df_clean)
         st.session_state.sample_data = True
         # Defer changing the widget-backed nav_choice until the next run
         st.session_state['nav_choice_pending'] = 'Overview'
@@ -156,6 +158,7 @@ def analyze_uploaded_data(uploaded_file) -> None:
 
         st.success(f"Successfully processed {len(df_clean)} tracks")
         st.session_state.df_processed = df_clean
+        st.session_state.df_key = dataframe_key(df_clean)
         st.session_state.sample_data = False
         # Defer changing the widget-backed nav_choice until the next run
         st.session_state['nav_choice_pending'] = 'Overview'
@@ -187,7 +190,9 @@ def show_analysis_results(df: pd.DataFrame, nav_choice: str) -> None:
         return
 
     if nav_choice == 'Visualizations':
-        render_visualizations(df)
+        if 'df_key' not in st.session_state:
+            st.session_state.df_key = dataframe_key(df)
+        render_visualizations(df, st.session_state.df_key)
         return
 
     # Emotions and Reflections require enriched data